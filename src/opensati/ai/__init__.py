@@ -1 +1,31 @@
 """AI integration module."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from opensati.ai.intent import IntentChecker
+    from opensati.ai.ollama_client import OllamaClient
+    from opensati.ai.sentiment import SentimentAnalyzer
+
+# Public names, imported from their submodule on first access
+_LAZY_ATTRS = {
+    "OllamaClient": "opensati.ai.ollama_client",
+    "IntentChecker": "opensati.ai.intent",
+    "SentimentAnalyzer": "opensati.ai.sentiment",
+}
+
+__all__ = ["IntentChecker", "OllamaClient", "SentimentAnalyzer"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import AI components lazily to keep startup fast."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from collections.abc import Callable
-from dataclasses import dataclass
+from concurrent.futures import Future, wait
+from dataclasses import dataclass, field
 
-from opensati.ai.ollama_client import OllamaClient
+from opensati.ai.ollama_client import OllamaClient, get_scheduler
 from opensati.config.settings import get_settings
 from opensati.core.vision import ScreenCapture
 
@@ -16,13 +18,39 @@ class IntentState:
     """Current intent checking state."""
 
     current_intent: str = ""
-    last_check_time: float = 0.0
+    last_check_time: float = 0.0  # time.monotonic() of the check
     last_match: bool = True
     last_explanation: str = ""
     mismatch_duration: float = 0.0
     is_enabled: bool = False
 
 
+@dataclass
+class _Frame:
+    """A captured screen, encoded for the model."""
+
+    image_bytes: bytes
+    dhash: int | None
+    captured_at: float
+    window: tuple[str, str] | None = None  # (app_name, window_title)
+
+
+@dataclass
+class _PendingCheck:
+    """
+    An intent check whose model call may still be in flight.
+
+    The future resolves to (matches, explanation, scene_description), where
+    scene_description is the vision model's neutral description of the
+    screen, or empty if the vision model didn't run.
+    """
+
+    frame: _Frame
+    intent: str  # Intent the frame is checked against
+    image_hash: int
+    future: Future | None = None
+
+
 @dataclass
 class IntentChecker:
     """
@@ -37,19 +65,28 @@ class IntentChecker:
     # Configuration
     check_interval: float = 30.0  # Seconds between checks
     mismatch_threshold: float = 120.0  # Seconds off-task before intervention
+    scene_change_bits: int = 5  # dHash distance above which the VLM is re-run
 
     # Callbacks
     on_mismatch_detected: Callable[[str, str], None] | None = None
     on_log: Callable[[str], None] | None = None
+    get_active_window: Callable[[], tuple[str, str]] | None = None  # (app_name, title)
 
     # Internal state
     _current_intent: str = ""
     _screen_capture: ScreenCapture | None = None
-    _ollama: OllamaClient | None = None
+    _ollama_client: OllamaClient | None = None
     _last_check: float = 0.0
     _mismatch_start: float | None = None
     _last_explanation: str = ""
+    _last_match: bool = True
+    _last_image_hash: int | None = None
+    _last_frame_dhash: int | None = None
+    _last_scene_description: str = ""
+    _state: IntentState = field(default_factory=IntentState)
     _running: bool = False
+    _worker: threading.Thread | None = None
+    _stop_event: threading.Event | None = None  # Owned by the current worker
 
     def __post_init__(self) -> None:
         """Initialize components."""
@@ -58,19 +95,31 @@ class IntentChecker:
         self.mismatch_threshold = settings.intent.mismatch_threshold * 60  # Convert to seconds
 
         self._screen_capture = ScreenCapture()
-        self._ollama = OllamaClient()
+
+    @property
+    def _ollama(self) -> OllamaClient:
+        """Ollama client, created on first use."""
+        if self._ollama_client is None:
+            self._ollama_client = OllamaClient()
+        return self._ollama_client
 
     def set_intent(self, intent: str) -> None:
         """Set the user's current work intent."""
         self._current_intent = intent.strip()
         self._mismatch_start = None
         self._last_explanation = ""
+        self._last_image_hash = None
+        self._last_frame_dhash = None
+        self._last_scene_description = ""
         print(f"🎯 Intent set: {self._current_intent}")
 
     def clear_intent(self) -> None:
         """Clear the current intent (disable checking)."""
         self._current_intent = ""
         self._mismatch_start = None
+        self._last_image_hash = None
+        self._last_frame_dhash = None
+        self._last_scene_description = ""
         print("🎯 Intent cleared")
 
     def start(self) -> bool:
@@ -79,98 +128,214 @@ class IntentChecker:
             print("⚠️ Intent checker requires Ollama. Install and run Ollama first.")
             return False
 
+        if self._running:
+            return True
+
+        # Each worker gets its own stop event, so one still winding down
+        # after stop() can't be revived by a restart
         self._running = True
+        self._stop_event = threading.Event()
+        self._worker = threading.Thread(
+            target=self._run, args=(self._stop_event,), daemon=True
+        )
+        self._worker.start()
         print("🎯 Intent checker started")
         return True
 
     def stop(self) -> None:
         """Stop intent checking."""
         self._running = False
+        if self._stop_event is not None:
+            self._stop_event.set()
+            self._stop_event = None
+        self._worker = None
         print("🎯 Intent checker stopped")
 
     def check(self) -> IntentState:
         """
-        Check if current screen matches intent.
+        Get the latest intent check result.
 
-        Returns current state.
+        Non-blocking: analysis runs on a background worker, so this only
+        returns the most recent state snapshot.
         """
         if not self._running:
             return IntentState(is_enabled=False)
-            
+
         if not self._current_intent:
             # Periodically remind user to set intent (every 5 mins)
             if self.on_log and int(time.time()) % 300 == 0:
-                 self.on_log("💡 Set a Goal in Settings to enable AI analysis")
+                self.on_log("💡 Set a Goal in Settings to enable AI analysis")
             return IntentState(is_enabled=False)
 
-        now = time.time()
-
-        # Check if enough time has passed
-        if now - self._last_check < self.check_interval:
-            mismatch_duration = 0.0
-            if self._mismatch_start:
-                mismatch_duration = now - self._mismatch_start
-
-            return IntentState(
-                current_intent=self._current_intent,
-                last_check_time=self._last_check,
-                last_match=self._mismatch_start is None,
-                last_explanation=self._last_explanation,
-                mismatch_duration=mismatch_duration,
-                is_enabled=True,
-            )
+        return self._state
+
+    def _run(self, stop_event: threading.Event) -> None:
+        """
+        Worker loop: analyze the screen every check_interval seconds.
+
+        Checks are pipelined: if inference overruns the interval, the next
+        frame is captured on schedule while the previous request is still
+        in flight, and only then is the previous result collected.
+        """
+        pending: _PendingCheck | None = None
+        next_tick = time.monotonic()
+
+        while not stop_event.is_set():
+            frame = self._capture_frame() if self._current_intent else None
+
+            if pending is not None:
+                self._state = self._finish_check(pending)
+                pending = None
 
-        self._last_check = now
+            if frame is not None:
+                pending = self._submit_check(frame)
+            elif self._current_intent:
+                self._state = IntentState(current_intent=self._current_intent, is_enabled=True)
 
-        # Capture screen
+            next_tick = max(next_tick + self.check_interval, time.monotonic())
+
+            # Publish the result as soon as it's ready if it beats the next tick
+            if pending is not None and pending.future is not None:
+                wait([pending.future], timeout=next_tick - time.monotonic())
+                if stop_event.is_set():
+                    break  # Stopped mid-check: don't publish a stale result
+            if pending is not None and (pending.future is None or pending.future.done()):
+                self._state = self._finish_check(pending)
+                pending = None
+
+            if stop_event.wait(max(0.0, next_tick - time.monotonic())):
+                break
+
+    def _capture_frame(self) -> _Frame | None:
+        """Capture the screen and encode it for analysis."""
         if self.on_log:
             self.on_log("📸 Capturing screen for analysis...")
-            
+
+        captured_at = time.monotonic()
+        window = self.get_active_window() if self.get_active_window else None
         self._screen_capture.capture()
         image_bytes = self._screen_capture.get_for_ai()
+        frame_dhash = self._screen_capture.get_dhash()
+
+        # Clear screenshot from memory
+        self._screen_capture.clear()
 
         if not image_bytes:
             if self.on_log:
                 self.on_log("⚠️ Screen capture returned empty")
-            return IntentState(
-                current_intent=self._current_intent,
-                is_enabled=True,
+            return None
+
+        return _Frame(image_bytes, frame_dhash, captured_at, window)
+
+    def _submit_check(self, frame: _Frame) -> _PendingCheck:
+        """
+        Start checking a frame against the current intent.
+
+        The model call runs on the shared Ollama scheduler; the returned
+        check has no future if the screen hasn't changed.
+        """
+        self._last_check = frame.captured_at
+        intent = self._current_intent  # set_intent() may change it meanwhile
+
+        image_hash = hash(frame.image_bytes)
+        if image_hash == self._last_image_hash:
+            return _PendingCheck(frame, intent, image_hash)
+
+        scene_unchanged = (
+            self._last_scene_description
+            and frame.dhash is not None
+            and self._last_frame_dhash is not None
+            and (frame.dhash ^ self._last_frame_dhash).bit_count() <= self.scene_change_bits
+        )
+
+        if scene_unchanged:
+            # Near-identical screen: reason over the cached description.
+            # The explanation is only needed if this check can fire the
+            # mismatch callback.
+            need_explanation = (
+                self.on_mismatch_detected is not None
+                and self._mismatch_start is not None
+                and frame.captured_at - self._mismatch_start >= self.mismatch_threshold
             )
+            if self.on_log:
+                self.on_log(f"🤖 Analyzing with {self._ollama.model}...")
 
-        # Check with AI
-        if self.on_log:
-            self.on_log(f"🤖 Analyzing with {self._ollama.model_name}...")
-            
-        matches, explanation = self._ollama.check_intent_match(
-            self._current_intent, image_bytes
+            future = get_scheduler().submit(
+                self._check_scene,
+                intent,
+                self._last_scene_description,
+                need_explanation,
+            )
+            return _PendingCheck(frame, intent, image_hash, future)
+
+        future = get_scheduler().submit(self._check_frame, intent, frame)
+        return _PendingCheck(frame, intent, image_hash, future)
+
+    def _check_scene(
+        self, intent: str, scene_description: str, need_explanation: bool
+    ) -> tuple[bool, str, str]:
+        """Check a cached scene description with the text model."""
+        matches, explanation = self._ollama.check_intent_match_text(
+            intent, scene_description, need_explanation
         )
-        
-        # Log result
+        return (matches, explanation, "")
+
+    def _check_frame(self, intent: str, frame: _Frame) -> tuple[bool, str, str]:
+        """
+        Check a new frame, trying the active window title first.
+
+        The vision model only runs if the title alone is inconclusive.
+        """
+        if frame.window and frame.window[1]:
+            result = self._ollama.check_intent_match_window(intent, *frame.window)
+            if result is not None:
+                return (*result, "")
+
         if self.on_log:
-            status = "✅ On Task" if matches else "❌ Distracted"
-            self.on_log(f"{status}: {explanation[:50]}...")
+            self.on_log(f"🤖 Analyzing with {self._ollama.vision_model}...")
 
-        # Clear screenshot from memory
-        self._screen_capture.clear()
+        return self._ollama.check_intent_match(intent, frame.image_bytes)
 
-        self._last_explanation = explanation
+    def _finish_check(self, pending: _PendingCheck) -> IntentState:
+        """Wait for a submitted check and update mismatch tracking."""
+        now = pending.frame.captured_at
 
-        # Track mismatch duration
-        if matches:
-            self._mismatch_start = None
+        if pending.future is None:
+            if pending.intent != self._current_intent:
+                return self.get_state()  # Intent changed since submitting
+            matches, explanation = self._last_match, self._last_explanation
         else:
-            if self._mismatch_start is None:
-                self._mismatch_start = now
-            else:
-                # Check if threshold exceeded
-                mismatch_duration = now - self._mismatch_start
-                if mismatch_duration >= self.mismatch_threshold:
-                    if self.on_mismatch_detected:
-                        self.on_mismatch_detected(self._current_intent, explanation)
+            matches, explanation, scene_description = pending.future.result()
+            if scene_description:
+                # Neutral description of the screen, valid for any intent
+                self._last_frame_dhash = pending.frame.dhash
+                self._last_scene_description = scene_description
 
-        mismatch_duration = 0.0
-        if self._mismatch_start:
-            mismatch_duration = now - self._mismatch_start
+            if pending.intent != self._current_intent:
+                # The intent changed while the model ran: the verdict was
+                # for the old one, so don't apply or cache it
+                return self.get_state()
+
+            self._last_image_hash = pending.image_hash
+            self._last_match = matches
+
+            # Log result
+            if self.on_log:
+                status = "✅ On Task" if matches else "❌ Distracted"
+                self.on_log(f"{status}: {explanation[:50]}..." if explanation else status)
+
+        self._last_explanation = explanation
+
+        # Track mismatch duration (monotonic, so clock changes can't skew it)
+        self._mismatch_start = None if matches else (self._mismatch_start or now)
+        mismatch_duration = now - self._mismatch_start if self._mismatch_start else 0.0
+
+        if (
+            not matches
+            and mismatch_duration >= self.mismatch_threshold
+            and self.on_mismatch_detected
+        ):
+            self.on_mismatch_detected(self._current_intent, explanation)
 
         return IntentState(
             current_intent=self._current_intent,
@@ -188,7 +353,7 @@ class IntentChecker:
 
         mismatch_duration = 0.0
         if self._mismatch_start:
-            mismatch_duration = time.time() - self._mismatch_start
+            mismatch_duration = time.monotonic() - self._mismatch_start
 
         return IntentState(
             current_intent=self._current_intent,
@@ -2,11 +2,242 @@
 
 from __future__ import annotations
 
-import base64
-from dataclasses import dataclass
+import re
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
 
 from opensati.config.settings import get_settings
 
+# Explanation returned when the model could not be reached
+ANALYSIS_FAILED = "Could not analyze"
+
+
+# Seconds to trust a positive / negative availability check
+AVAILABLE_TTL = 60.0
+UNAVAILABLE_RETRY = 5.0
+
+# Seconds to reuse an ollama.list() response
+LIST_TTL = 2.0
+
+# How long the server keeps model weights (and cached prompt prefix) loaded
+KEEP_ALIVE = "10m"
+
+# Intent-check prompts. Kept as constants so every request starts with
+# byte-identical text and the server can reuse its cached prompt prefix.
+_INTENT_SYSTEM = """You are a focus assistant. Be lenient - if the content could
+reasonably be related to work (research, documentation, tutorials), say YES.
+Only say NO for obvious distractions like social media, games, or unrelated videos."""
+
+_INTENT_PREFIX = 'The user said they are working on: "'
+
+_INTENT_ANSWER_FORMAT = """Answer with:
+1. YES or NO
+2. Brief explanation (one sentence)
+
+Format: YES/NO: explanation"""
+
+# The vision check also asks for a neutral description of the screen, which
+# is cached and re-checked with the text model while the screen is unchanged
+_INTENT_IMAGE_SUFFIX = '''"
+
+Look at this screenshot. Is the content related to their stated work?
+
+Answer with:
+1. YES or NO
+2. Brief explanation (one sentence)
+3. Neutral description of what is on screen (one sentence, no verdict)
+
+Format:
+YES/NO: explanation
+SCENE: description'''
+
+_INTENT_TEXT_MIDDLE = '"\n\nTheir screen currently shows: '
+
+_INTENT_TEXT_SUFFIX = (
+    "\n\nIs the content related to their stated work?\n\n" + _INTENT_ANSWER_FORMAT
+)
+
+_INTENT_WINDOW_MIDDLE = '"\n\nTheir active window is: '
+
+_INTENT_WINDOW_SUFFIX = """
+
+Is this window clearly related to their stated work?
+Answer with exactly one word: YES, NO, or UNSURE (if the title alone is not enough)."""
+
+# "SCENE: ..." line of a vision intent response
+_SCENE_FIELD = re.compile(r"^[ \t]*SCENE:[ \t]*(.*?)[ \t\r]*$", re.MULTILINE | re.IGNORECASE)
+
+# "SENTIMENT: ..." / "REFRAME: ..." lines of a sentiment response
+_SENTIMENT_FIELDS = re.compile(r"^(SENTIMENT|REFRAME):[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
+_ollama = None
+_client = None
+_client_lock = threading.Lock()
+
+_list_cache: tuple[float, frozenset[str]] | None = None
+_list_lock = threading.Lock()
+
+
+def _get_ollama() -> Any:
+    """
+    Import the ollama package on first use.
+
+    ollama pulls in httpx and pydantic, so startup skips that cost until
+    the first AI call.
+    """
+    global _ollama
+    if _ollama is None:
+        import ollama
+
+        _ollama = ollama
+    return _ollama
+
+
+def get_client() -> Any:
+    """
+    Get the shared ollama.Client.
+
+    One client keeps a pooled keep-alive connection to the local server
+    instead of the module-level helpers opening a new one per call.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # HTTP timeout, so a hung server can't block a worker (and
+                # quitting) forever. Doubled to cover vision calls.
+                _client = _get_ollama().Client(timeout=get_settings().ai.timeout * 2)
+    return _client
+
+
+def close_client() -> None:
+    """Close the shared client's connections; in-flight requests fail fast."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def list_models() -> frozenset[str]:
+    """
+    Get the names of installed models, memoized for LIST_TTL seconds.
+
+    Contains both full names ("llava:latest") and base names ("llava"),
+    so membership checks are a single set lookup. Back-to-back checks
+    during startup share a single HTTP round-trip.
+    """
+    global _list_cache
+
+    with _list_lock:
+        now = time.monotonic()
+        if _list_cache is not None and now - _list_cache[0] < LIST_TTL:
+            return _list_cache[1]
+
+        names: set[str] = set()
+        for m in get_client().list().get("models", []):
+            name = m.get("model") or m.get("name") or ""
+            names.add(name)
+            names.add(name.split(":")[0])
+
+        models = frozenset(names)
+        _list_cache = (now, models)
+        return models
+
+
+def has_model(name: str, available: frozenset[str]) -> bool:
+    """Check if a model (with or without tag) is in list_models()."""
+    return name in available or name.split(":")[0] in available
+
+
+def _downscale_image(image_bytes: bytes, max_dimension: int) -> bytes:
+    """
+    Shrink an encoded image to fit within max_dimension pixels.
+
+    Images that already fit are returned unchanged; larger ones are
+    re-encoded as JPEG, which cuts both payload and vision tokens.
+    """
+    from io import BytesIO
+
+    from PIL import Image
+
+    with Image.open(BytesIO(image_bytes)) as img:
+        if max(img.size) <= max_dimension:
+            return image_bytes
+
+        img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+        buffer = BytesIO()
+        img.convert("RGB").save(buffer, format="JPEG", quality=85)
+
+    return buffer.getvalue()
+
+
+def _has_verdict(text: str) -> bool:
+    """Check if a streamed response has produced its YES/NO verdict."""
+    return text.lstrip().upper().startswith(("YES", "NO"))
+
+
+def _has_window_verdict(text: str) -> bool:
+    """Check if a streamed response has produced its YES/NO/UNSURE verdict."""
+    return text.lstrip().upper().startswith(("YES", "NO", "UNSURE"))
+
+
+@dataclass
+class BatchScheduler:
+    """
+    Runs Ollama requests from different subsystems concurrently.
+
+    Ollama has no batch API, but the server schedules concurrent requests
+    into the same forward passes, so pending prompts are dispatched in
+    parallel instead of queueing behind each other.
+    """
+
+    max_workers: int = 4
+
+    # Internal state
+    _executor: ThreadPoolExecutor | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue a blocking Ollama call and return its future."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="opensati-ollama",
+                    )
+        return self._executor.submit(fn, *args)
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker pool.
+
+        Pool threads are joined at interpreter exit, so the client is closed
+        too: calls still in flight error out instead of holding up quitting.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+        close_client()
+
+
+# Shared scheduler instance
+_scheduler: BatchScheduler | None = None
+
+
+def get_scheduler() -> BatchScheduler:
+    """Get the shared Ollama request scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = BatchScheduler()
+    return _scheduler
+
 
 @dataclass
 class OllamaClient:
@@ -21,7 +252,10 @@ class OllamaClient:
     timeout: int = 10
 
     # Internal state
-    _available: bool | None = None
+    _available: bool = False
+    _checked_at: float = float("-inf")
+    _last_image_hash: int | None = None
+    _last_image_payload: bytes | None = None
 
     def __post_init__(self) -> None:
         """Initialize with settings if not provided."""
@@ -34,38 +268,90 @@ class OllamaClient:
             self.timeout = settings.ai.timeout
 
     def is_available(self) -> bool:
-        """Check if Ollama is running and model is available."""
-        if self._available is not None:
-            return self._available
+        """
+        Check if Ollama is running and model is available.
 
-        try:
-            import ollama
+        Positive results are cached for AVAILABLE_TTL seconds; negative
+        results are retried after UNAVAILABLE_RETRY so a restarted server
+        is picked up without restarting the app.
+        """
+        ttl = AVAILABLE_TTL if self._available else UNAVAILABLE_RETRY
+        if time.monotonic() - self._checked_at < ttl:
+            return self._available
 
-            # Try to list models
-            models = ollama.list()
-            available_models = [m["name"] for m in models.get("models", [])]
+        was_available = self._available
+        first_check = self._checked_at == float("-inf")
+        self._checked_at = time.monotonic()
 
+        try:
             # Check if our models are available
-            has_text = any(self.model in m for m in available_models)
-            has_vision = any(self.vision_model in m for m in available_models)
+            available_models = list_models()
+            has_text = has_model(self.model, available_models)
+            has_vision = has_model(self.vision_model, available_models)
 
             self._available = has_text or has_vision
 
-            if not self._available:
+            if not self._available and (was_available or first_check):
                 print(f"⚠️ Models not found. Run: ollama pull {self.model}")
 
             return self._available
 
         except ImportError:
-            print("⚠️ Ollama package not installed")
+            if first_check:
+                print("⚠️ Ollama package not installed")
             self._available = False
             return False
         except Exception as e:
-            print(f"⚠️ Could not connect to Ollama: {e}")
+            if was_available or first_check:
+                print(f"⚠️ Could not connect to Ollama: {e}")
             self._available = False
             return False
 
-    def chat(self, prompt: str, system: str | None = None) -> str | None:
+    def _complete(
+        self,
+        model: str,
+        messages: list[dict],
+        options: dict,
+        stop_when: Callable[[str], bool] | None = None,
+    ) -> str:
+        """
+        Run a chat completion and return the response text.
+
+        With stop_when, the response is streamed and generation is abandoned
+        as soon as stop_when(text_so_far) is true.
+        """
+        client = get_client()
+
+        if stop_when is None:
+            response = client.chat(
+                model=model, messages=messages, options=options, keep_alive=KEEP_ALIVE
+            )
+            return response["message"]["content"]
+
+        stream = client.chat(
+            model=model,
+            messages=messages,
+            options=options,
+            stream=True,
+            keep_alive=KEEP_ALIVE,
+        )
+        parts: list[str] = []
+        try:
+            for chunk in stream:
+                parts.append(chunk["message"]["content"])
+                if stop_when("".join(parts)):
+                    break
+        finally:
+            stream.close()  # Drops the connection so the server stops generating
+
+        return "".join(parts)
+
+    def chat(
+        self,
+        prompt: str,
+        system: str | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+    ) -> str | None:
         """
         Send a text prompt to the local LLM.
 
@@ -75,87 +361,141 @@ class OllamaClient:
             return None
 
         try:
-            import ollama
-
             messages = []
             if system:
                 messages.append({"role": "system", "content": system})
             messages.append({"role": "user", "content": prompt})
 
-            response = ollama.chat(
-                model=self.model,
-                messages=messages,
-                options={"timeout": self.timeout},
+            return self._complete(
+                self.model,
+                messages,
+                {"timeout": self.timeout},
+                stop_when,
             )
 
-            return response["message"]["content"]
-
         except Exception as e:
             print(f"⚠️ Ollama chat failed: {e}")
             return None
 
     def analyze_image(
-        self, image_bytes: bytes, prompt: str, system: str | None = None
+        self,
+        image_bytes: bytes,
+        prompt: str,
+        system: str | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+        max_dimension: int = 672,
     ) -> str | None:
         """
         Analyze an image with the vision model.
 
+        Images larger than max_dimension (LLaVA's native tile size by
+        default) are downscaled before encoding.
         Returns response text or None on failure.
         """
         if not self.is_available():
             return None
 
         try:
-            import ollama
-
-            # Encode image as base64
-            image_b64 = base64.b64encode(image_bytes).decode("utf-8")
+            # Downscale (reuse last result for identical frames). Raw bytes
+            # are passed through: the client base64-encodes them once while
+            # serializing, whereas a base64 string is stat()ed as a path and
+            # decoded again for validation on every request.
+            image_hash = hash((image_bytes, max_dimension))
+            if image_hash != self._last_image_hash or self._last_image_payload is None:
+                self._last_image_payload = _downscale_image(image_bytes, max_dimension)
+                self._last_image_hash = image_hash
+            payload = self._last_image_payload
 
             messages = []
             if system:
                 messages.append({"role": "system", "content": system})
             messages.append(
-                {"role": "user", "content": prompt, "images": [image_b64]}
+                {"role": "user", "content": prompt, "images": [payload]}
             )
 
-            response = ollama.chat(
-                model=self.vision_model,
-                messages=messages,
-                options={"timeout": self.timeout * 2},  # Vision takes longer
+            return self._complete(
+                self.vision_model,
+                messages,
+                {"timeout": self.timeout * 2},  # Vision takes longer
+                stop_when,
             )
 
-            return response["message"]["content"]
-
         except Exception as e:
             print(f"⚠️ Ollama vision failed: {e}")
             return None
 
     def check_intent_match(
-        self, intent: str, image_bytes: bytes
-    ) -> tuple[bool, str]:
+        self, intent: str, image_bytes: bytes, need_explanation: bool = True
+    ) -> tuple[bool, str, str]:
         """
         Check if screen content matches user's stated intent.
 
+        Without need_explanation, generation stops at the YES/NO verdict
+        and no scene description is produced.
+        Returns (matches, explanation, scene_description).
+        """
+        prompt = "".join((_INTENT_PREFIX, intent, _INTENT_IMAGE_SUFFIX))
+
+        stop_when = None if need_explanation else _has_verdict
+        response = self.analyze_image(image_bytes, prompt, _INTENT_SYSTEM, stop_when)
+
+        scene = ""
+        if response:
+            match = _SCENE_FIELD.search(response)
+            if match:
+                scene = match.group(1)
+            response = _SCENE_FIELD.sub("", response)
+
+        return (*self._parse_intent_response(response), scene)
+
+    def check_intent_match_text(
+        self, intent: str, scene_description: str, need_explanation: bool = True
+    ) -> tuple[bool, str]:
+        """
+        Check a cached scene description against the user's intent.
+
+        Uses the text model only, skipping the vision encoder. Without
+        need_explanation, generation stops at the YES/NO verdict.
         Returns (matches, explanation).
         """
-        prompt = f"""The user said they are working on: "{intent}"
+        prompt = "".join(
+            (_INTENT_PREFIX, intent, _INTENT_TEXT_MIDDLE, scene_description, _INTENT_TEXT_SUFFIX)
+        )
 
-Look at this screenshot. Is the content related to their stated work?
+        stop_when = None if need_explanation else _has_verdict
+        response = self.chat(prompt, _INTENT_SYSTEM, stop_when)
 
-Answer with:
-1. YES or NO
-2. Brief explanation (one sentence)
+        return self._parse_intent_response(response)
 
-Format: YES/NO: explanation"""
+    def check_intent_match_window(
+        self, intent: str, app_name: str, window_title: str
+    ) -> tuple[bool, str] | None:
+        """
+        Check the active window against the user's intent, text model only.
 
-        system = """You are a focus assistant. Be lenient - if the content could
-reasonably be related to work (research, documentation, tutorials), say YES.
-Only say NO for obvious distractions like social media, games, or unrelated videos."""
+        Lets obvious cases skip the screenshot and vision model entirely.
+        Returns (matches, explanation), or None if the title isn't enough.
+        """
+        window = f"{window_title} ({app_name})" if app_name else window_title
+        prompt = "".join((_INTENT_PREFIX, intent, _INTENT_WINDOW_MIDDLE, window, _INTENT_WINDOW_SUFFIX))
 
-        response = self.analyze_image(image_bytes, prompt, system)
+        response = self.chat(prompt, _INTENT_SYSTEM, _has_window_verdict)
+        if not response:
+            return None
 
+        verdict = response.lstrip().upper()
+        if verdict.startswith("UNSURE"):
+            return None
+        if verdict.startswith("YES"):
+            return (True, f"Active window: {window}")
+        if verdict.startswith("NO"):
+            return (False, f"Active window: {window}")
+        return None
+
+    def _parse_intent_response(self, response: str | None) -> tuple[bool, str]:
+        """Parse a "YES/NO: explanation" answer into (matches, explanation)."""
         if not response:
-            return (True, "Could not analyze")  # Fail open
+            return (True, ANALYSIS_FAILED)  # Fail open
 
         response = response.strip().upper()
         matches = response.startswith("YES")
@@ -186,16 +526,13 @@ REFRAME: [suggested alternative or "none"]"""
         if not response:
             return ("neutral", None)
 
-        lines = response.strip().split("\n")
         sentiment = "neutral"
         reframe = None
 
-        for line in lines:
-            if line.startswith("SENTIMENT:"):
-                sentiment = line.split(":", 1)[-1].strip().lower()
-            elif line.startswith("REFRAME:"):
-                reframe_text = line.split(":", 1)[-1].strip()
-                if reframe_text.lower() != "none":
-                    reframe = reframe_text
+        for field_name, value in _SENTIMENT_FIELDS.findall(response):
+            if field_name == "SENTIMENT":
+                sentiment = value.lower()
+            elif value.lower() != "none":
+                reframe = value
 
         return (sentiment, reframe)
@@ -6,12 +6,19 @@ Handles checking for Ollama and installing it if missing.
 
 from __future__ import annotations
 
+import os
 import platform
 import shutil
 import subprocess
+import tempfile
 from dataclasses import dataclass
 from typing import Callable
 
+from opensati.ai.ollama_client import get_client, has_model, list_models
+
+# Default address of the local Ollama server
+OLLAMA_ADDRESS = ("127.0.0.1", 11434)
+
 
 @dataclass
 class OllamaSetup:
@@ -31,8 +38,7 @@ class OllamaSetup:
     def is_running(self) -> bool:
         """Check if Ollama server is running."""
         try:
-            import ollama
-            ollama.list()
+            list_models()
             return True
         except Exception:
             return False
@@ -62,32 +68,34 @@ class OllamaSetup:
         self._log("📦 Installing Ollama...")
         
         try:
-            # Run official install script
-            result = subprocess.run(
-                ["curl", "-fsSL", "https://ollama.com/install.sh"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode != 0:
-                self._log("⚠️ Failed to download Ollama installer")
-                return False
-            
-            # Pipe to sh
-            install_result = subprocess.run(
-                ["sh"],
-                input=result.stdout,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            with tempfile.TemporaryDirectory() as tmp:
+                # Download the whole script before running any of it, so a
+                # dropped connection can't execute a truncated installer.
+                # curl writes the file itself; it never passes through Python.
+                script = os.path.join(tmp, "install.sh")
+                try:
+                    subprocess.run(
+                        ["curl", "-fsSL", "-o", script, "https://ollama.com/install.sh"],
+                        capture_output=True,
+                        timeout=30,
+                        check=True,
+                    )
+                except subprocess.CalledProcessError:
+                    self._log("⚠️ Failed to download Ollama installer")
+                    return False
+
+                install = subprocess.run(
+                    ["sh", script],
+                    capture_output=True,
+                    text=True,
+                    timeout=120
+                )
             
-            if install_result.returncode == 0:
+            if install.returncode == 0:
                 self._log("✅ Ollama installed successfully")
                 return True
             else:
-                self._log(f"⚠️ Installation failed: {install_result.stderr[:100]}")
+                self._log(f"⚠️ Installation failed: {install.stderr[:100]}")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -121,19 +129,14 @@ class OllamaSetup:
             return False
         
         try:
-            import ollama
-            
             # Check if model exists
-            models = ollama.list()
-            available = [m.get("name", "") for m in models.get("models", [])]
-            
-            if any(model_name in m for m in available):
+            if has_model(model_name, list_models()):
                 self._log(f"✅ Model {model_name} ready")
                 return True
             
             # Pull model
             self._log(f"📥 Pulling {model_name} model...")
-            ollama.pull(model_name)
+            get_client().pull(model_name)
             self._log(f"✅ Model {model_name} downloaded")
             return True
             
@@ -157,14 +160,26 @@ class OllamaSetup:
                 start_new_session=True
             )
             
-            # Wait for server to be ready
+            # Wait for the port to accept connections, backing off between probes
+            import socket
             import time
-            for _ in range(10):
-                time.sleep(1)
+
+            delay = 0.05
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                try:
+                    socket.create_connection(OLLAMA_ADDRESS, timeout=0.05).close()
+                except OSError:
+                    time.sleep(delay)
+                    delay = min(delay * 2, 0.5)
+                    continue
+
+                # Port is open - confirm the API answers
                 if self.is_running():
                     self._log("✅ Ollama server started")
                     return True
-            
+                time.sleep(delay)
+
             self._log("⚠️ Server didn't start in time")
             return False
             
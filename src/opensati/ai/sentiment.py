@@ -2,10 +2,41 @@
 
 from __future__ import annotations
 
+import re
+import string
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from opensati.ai.ollama_client import OllamaClient
+from opensati.ai.ollama_client import OllamaClient, get_scheduler
+
+# Words that make text worth a full LLM tone analysis
+_CHARGED_WORDS = frozenset({
+    "idiot", "idiots", "idiotic", "stupid", "dumb", "moron", "hate", "hated",
+    "useless", "pathetic", "incompetent", "ridiculous", "unacceptable",
+    "terrible", "awful", "worst", "garbage", "trash", "crap", "damn", "hell",
+    "wtf", "annoying", "annoyed", "angry", "furious", "disappointed",
+    "frustrated", "frustrating", "lazy", "clueless", "seriously",
+})
+
+# Phrases and markers typical of aggressive or passive-aggressive text
+_CHARGED_PATTERN = re.compile(
+    r"\b(you always|you never|shut up|how many times|as i already said|"
+    r"as previously stated|per my last|i told you|what is wrong with|"
+    r"are you kidding|for the last time|whatever)\b|!{2,}|\?{2,}",
+    re.IGNORECASE,
+)
+
+
+def is_potentially_charged(text: str) -> bool:
+    """
+    Cheap lexical check for text that may need a reframe.
+
+    Only text that passes this filter is sent to the LLM.
+    """
+    words = {word.strip(string.punctuation).lower() for word in text.split()}
+    if not words.isdisjoint(_CHARGED_WORDS):
+        return True
+    return _CHARGED_PATTERN.search(text) is not None
 
 
 @dataclass
@@ -36,7 +67,7 @@ class SentimentAnalyzer:
     on_aggressive_detected: Callable[[str, str], None] | None = None
 
     # Internal state
-    _ollama: OllamaClient | None = None
+    _ollama_client: OllamaClient | None = None
     _enabled: bool = False
 
     def __post_init__(self) -> None:
@@ -44,7 +75,12 @@ class SentimentAnalyzer:
         if self.trigger_sentiments is None:
             self.trigger_sentiments = ["aggressive", "negative"]
 
-        self._ollama = OllamaClient()
+    @property
+    def _ollama(self) -> OllamaClient:
+        """Ollama client, created on first use."""
+        if self._ollama_client is None:
+            self._ollama_client = OllamaClient()
+        return self._ollama_client
 
     def start(self) -> bool:
         """Start sentiment analysis."""
@@ -74,7 +110,13 @@ class SentimentAnalyzer:
         if len(text.split()) < 5:
             return SentimentResult(original_text=text)
 
-        sentiment, reframe = self._ollama.analyze_sentiment(text)
+        # Skip the LLM for text with no aggressive markers
+        if not is_potentially_charged(text):
+            return SentimentResult(sentiment="neutral", original_text=text)
+
+        sentiment, reframe = get_scheduler().submit(
+            self._ollama.analyze_sentiment, text
+        ).result()
 
         needs_reframe = sentiment in self.trigger_sentiments and reframe is not None
 
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+import atexit
+import heapq
+import logging
+import logging.handlers
+import queue
 import sys
 import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 import customtkinter as ctk
 
@@ -17,11 +25,46 @@ from opensati.interventions.decompression import DecompressionScreen
 from opensati.interventions.grayscale import GrayscaleEffect
 from opensati.interventions.overlay import NotificationOverlay
 from opensati.ui.intent_bar import IntentBar
+from opensati.ui.overlay_window import call_on_tk
 from opensati.ui.settings import SettingsWindow
 from opensati.ui.tray import TrayIcon
 
+if TYPE_CHECKING:
+    from opensati.ai.intent import IntentChecker
+    from opensati.ui.widget import FloatingWidget
 
-@dataclass
+logger = logging.getLogger("opensati")
+
+
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """
+    Route opensati log records through a queue to stdout.
+
+    Event callbacks only enqueue; formatting and the terminal write
+    happen on the listener's thread.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return listener
+
+
+# (DetectorState attribute, label, unit) for each sensor logged per cycle
+_SENSOR_ROWS = (
+    ("input_score", "⌨️ Typing", "% intensity"),
+    ("breathing_score", "🫁 Breathing", "% stress"),
+    ("posture_score", "🪑 Posture", "% tension"),
+)
+
+
+@dataclass(slots=True)
 class OpenSatiApp:
     """
     Main OpenSati application.
@@ -42,14 +85,24 @@ class OpenSatiApp:
     _intent_bar: IntentBar | None = None
 
     # AI components (optional)
-    _intent_checker = None
+    _intent_checker: IntentChecker | None = None
     _screen_capture: ScreenCapture | None = None
     _activity_monitor: ActivityMonitor | None = None
 
     # State
     _running: bool = False
-    _monitor_thread: threading.Thread | None = None
+    _checks: tuple[Callable[[], object], ...] = ()
+    _tasks: dict[str, tuple[float, Callable[[], object]]] = field(default_factory=dict)
+    _schedule: list[tuple[float, str]] = field(default_factory=list)
+    _tick_id: str | None = None
+    _executor: ThreadPoolExecutor = field(
+        default_factory=lambda: ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="opensati-capture"
+        )
+    )
     _root: ctk.CTk | None = None
+    _widget: FloatingWidget | None = None  # Used when the tray is unavailable
+    _log_listener: logging.handlers.QueueListener | None = None
 
     def __post_init__(self) -> None:
         """Initialize components."""
@@ -114,10 +167,17 @@ class OpenSatiApp:
             self._intent_checker = IntentChecker(
                 on_mismatch_detected=self._on_intent_mismatch,
                 on_log=self._log,
+                get_active_window=self._get_active_window,
             )
         except ImportError:
             print("⚠️ Intent checker not available")
 
+    def _get_active_window(self) -> tuple[str, str]:
+        """Get the active (app_name, window_title) for intent pre-checks."""
+        if self._activity_monitor:
+            return self._activity_monitor.get_active_window()
+        return ("", "")
+
     def _setup_ollama(self) -> None:
         """Auto-setup Ollama if not installed."""
         try:
@@ -138,6 +198,9 @@ class OpenSatiApp:
 
     def run(self) -> None:
         """Run the application."""
+        self._log_listener = _start_log_listener()
+        atexit.register(self._log_listener.stop)  # Flushes queued records
+
         print("\n" + "=" * 50)
         print("🧘 OpenSati - The Intelligent Mirror for Deep Work")
         print("=" * 50)
@@ -151,6 +214,14 @@ class OpenSatiApp:
         self._root = ctk.CTk()
         self._root.withdraw()  # Hide main window
 
+        # Interventions build widgets and step fades on the Tk loop
+        if self._grayscale:
+            self._grayscale.tk_root = self._root
+        if self._notification:
+            self._notification.tk_root = self._root
+        if self._decompression:
+            self._decompression.tk_root = self._root
+
         # Start components
         self._start()
 
@@ -186,12 +257,12 @@ class OpenSatiApp:
 
     def _update_widget_state(self, state: str) -> None:
         """Update floating widget appearance."""
-        if hasattr(self, "_widget"):
+        if self._widget:
             self._widget.set_status(state)
 
     def _log(self, message: str) -> None:
         """Log message to widget if available."""
-        if hasattr(self, "_widget"):
+        if self._widget:
             self._widget.log(message)
 
     def _start(self) -> None:
@@ -208,10 +279,10 @@ class OpenSatiApp:
 
         # Start intent checker if enabled
         if self._intent_checker and self.settings.sensors.screen:
-            self._intent_checker.start()
-            # Set default intent to enable immediate analysis
+            # Set default intent first so the worker analyzes immediately
             self._intent_checker.set_intent("General Productivity")
             self._log("🎯 Default goal set: General Productivity")
+            self._intent_checker.start()
 
         # Start activity monitor
         if self._activity_monitor:
@@ -221,90 +292,132 @@ class OpenSatiApp:
         if self._tray:
             self._tray.start()
 
-        # Start monitoring loop
-        self._monitor_thread = threading.Thread(
-            target=self._monitor_loop, daemon=True
-        )
-        self._monitor_thread.start()
+        # Start monitoring on the tk event loop
+        self._start_monitoring()
 
         print("✅ OpenSati running. Access settings from the system tray.")
 
-    def _monitor_loop(self) -> None:
-        """Main monitoring loop with activity logging."""
-        check_interval = 2.0  # Seconds
-        log_interval = 5.0    # Log every 5 seconds
-        last_log_time = 0
+    def _start_monitoring(self) -> None:
+        """Build the task schedule and arm the first tick on the tk loop."""
+        # Components don't change after setup, so resolve which checks to
+        # run once instead of testing each component every tick
+        checks: list[Callable[[], object]] = []
+        # Check and intervene
+        if self._detector:
+            checks.append(self._detector.check_and_intervene)
+        # Check intent if enabled
+        if self._intent_checker:
+            checks.append(self._intent_checker.check)
+        # Check activity (logs app switches automatically)
+        if self._activity_monitor:
+            checks.append(self._activity_monitor.check)
+        self._checks = tuple(checks)
+
+        self._tasks = {
+            "check": (2.0, self._run_checks),
+            "log": (5.0, self._log_sensors),
+        }
+        if self._screen_capture:
+            # Capture blocks on the OS, so it runs off the UI thread
+            self._tasks["screen"] = (
+                self._screen_capture.capture_interval,
+                lambda: self._executor.submit(self._screen_capture.capture),
+            )
 
-        while self._running:
-            time.sleep(check_interval)
+        # Each task is first due one period from now, except screen capture,
+        # which runs right away so the first log cycle has a screen state
+        now = time.monotonic()
+        self._schedule = [
+            (now if name == "screen" else now + period, name)
+            for name, (period, _) in self._tasks.items()
+        ]
+        heapq.heapify(self._schedule)
+        self._arm_tick()
+
+    def _arm_tick(self) -> None:
+        """Schedule the next tick for when the earliest task is due."""
+        delay = max(0.0, self._schedule[0][0] - time.monotonic())
+        self._tick_id = self._root.after(int(delay * 1000), self._tick)
+
+    def _tick(self) -> None:
+        """
+        Run monitoring tasks that are due, then re-arm.
+
+        Runs on tk's event loop; due times are kept in a min-heap so the
+        app only wakes when a task is actually due.
+        """
+        if not self._running:
+            return
+
+        schedule, tasks, tray = self._schedule, self._tasks, self._tray
+
+        now = time.monotonic()
+        while schedule[0][0] <= now:
+            due, name = schedule[0]
+            period, task = tasks[name]
+            # Don't burst to catch up if a task overran
+            heapq.heapreplace(schedule, (max(due + period, now), name))
 
             # Skip if paused
-            if self._tray and self._tray.is_paused:
-                self._log("⏸️ Monitoring paused...")
+            if tray and tray.is_paused:
+                if name == "check":
+                    self._log("⏸️ Monitoring paused...")
                 continue
 
-            # Get detector state and log periodically
-            if self._detector:
-                state = self._detector.get_state()
-                current_time = time.time()
-                
-                # Log sensor data every log_interval seconds
-                if current_time - last_log_time >= log_interval:
-                    last_log_time = current_time
-                    
-                    # Check and log sensor status
-                    sensors_active = False
-                    
-                    # Log typing rate or show guidance
-                    if state.input_score > 0:
-                        self._log(f"⌨️ Typing: {state.input_score:.0f}% intensity")
-                        sensors_active = True
-                    elif self._detector._input_sensor and not self._detector._input_sensor._running:
-                        # Sensor exists but not running - needs permissions
-                        self._log("⚠️ Input sensors disabled - needs Accessibility permission")
-                    
-                    # Log breathing if available
-                    if state.breathing_score > 0:
-                        self._log(f"🫁 Breathing: {state.breathing_score:.0f}% stress")
-                        sensors_active = True
-                    
-                    # Log posture if available  
-                    if state.posture_score > 0:
-                        self._log(f"🪑 Posture: {state.posture_score:.0f}% tension")
-                        sensors_active = True
-                    
-                    # Log overall stress
-                    self._log(f"📊 Stress level: {state.score:.0f}/100 ({state.level.value})")
-
-                    # Screen analysis
-                    if hasattr(self, "_screen_capture") and self._screen_capture:
-                        # Periodically capture screen (every 3rd log cycle to save resources)
-                        if int(current_time) % 15 < 2:
-                            self._screen_capture.capture()
-                        
-                        screen_state = self._screen_capture.get_state()
-                        if screen_state.has_screenshot:
-                            self._log(f"🖥️ Screen: Active (Brightness: {screen_state.brightness:.1f})")
-                            sensors_active = True
-                    
-                    # Show guidance if no sensors active
-                    if not sensors_active and state.score == 0:
-                        self._log("💡 Add Terminal to: System Settings → Privacy → Accessibility")
-                
-                # Check and intervene
-                self._detector.check_and_intervene()
+            task()
 
-            # Check intent if enabled
-            if self._intent_checker:
-                self._intent_checker.check()
-            
-            # Check activity (logs app switches automatically)
-            if self._activity_monitor:
-                self._activity_monitor.check()
+        self._arm_tick()
+
+    def _run_checks(self) -> None:
+        """Check for interventions, intent and activity."""
+        for check in self._checks:
+            check()
+
+    def _log_sensors(self) -> None:
+        """Log sensor data as one multi-line entry."""
+        if not self._detector:
+            return
+
+        state = self._detector.get_state()
+
+        # Collected and written to the log in one call
+        lines: list[str] = []
+
+        # Check and log sensor status
+        sensors_active = False
+        
+        # Input sensor exists but not running - needs permissions
+        input_sensor = self._detector._input_sensor
+        if state.input_score <= 0 and input_sensor and not input_sensor._running:
+            lines.append("⚠️ Input sensors disabled - needs Accessibility permission")
+        
+        # Log each active sensor's score
+        for attr, label, unit in _SENSOR_ROWS:
+            value = getattr(state, attr)
+            if value > 0:
+                lines.append(f"{label}: {value:.0f}{unit}")
+                sensors_active = True
+        
+        # Log overall stress
+        lines.append(f"📊 Stress level: {state.score:.0f}/100 ({state.level.value})")
+
+        # Screen analysis (captured on its own schedule)
+        if self._screen_capture:
+            screen_state = self._screen_capture.get_state()
+            if screen_state.has_screenshot:
+                lines.append(f"🖥️ Screen: Active (Brightness: {screen_state.brightness:.1f})")
+                sensors_active = True
+        
+        # Show guidance if no sensors active
+        if not sensors_active and state.score == 0:
+            lines.append("💡 Add Terminal to: System Settings → Privacy → Accessibility")
+
+        if lines:
+            self._log("\n".join(lines))
 
     def _on_stress_detected(self, level: StressLevel, score: float) -> None:
         """Handle stress detection."""
-        print(f"⚡ Stress detected: {level.value} ({score:.0f})")
+        logger.info("⚡ Stress detected: %s (%.0f)", level.value, score)
 
         # Update tray icon
         if self._tray:
@@ -316,7 +429,7 @@ class OpenSatiApp:
         style = self.settings.intervention.style
 
         if style == "grayscale" and self._grayscale:
-            self._grayscale.start_fade()
+            call_on_tk(self._root, self._grayscale.start_fade)
             # Also show notification
             if self._notification:
                 self._show_notification("You're typing fast. Take a breath?")
@@ -330,7 +443,7 @@ class OpenSatiApp:
 
     def _on_calm_restored(self) -> None:
         """Handle return to calm state."""
-        print("🌿 Calm restored")
+        logger.info("🌿 Calm restored")
 
         # Update tray icon
         if self._tray:
@@ -341,11 +454,11 @@ class OpenSatiApp:
     def _show_notification(self, message: str) -> None:
         """Show intervention notification (thread-safe)."""
         if self._root and self._notification:
-            self._root.after(0, lambda: self._notification.show(message))
+            call_on_tk(self._root, lambda: self._notification.show(message))
 
     def _on_intervention_accept(self) -> None:
         """Handle user accepting intervention."""
-        print("🧘 User accepted intervention")
+        logger.info("🧘 User accepted intervention")
 
         # Restore color
         if self._grayscale and self._grayscale.is_active():
@@ -359,12 +472,12 @@ class OpenSatiApp:
 
     def _on_intervention_dismiss(self) -> None:
         """Handle user dismissing intervention."""
-        print("⏭️ User dismissed intervention")
+        logger.info("⏭️ User dismissed intervention")
         # Grayscale will auto-restore after hold duration
 
     def _on_intent_mismatch(self, intent: str, explanation: str) -> None:
         """Handle intent-reality mismatch."""
-        print(f"❓ Intent mismatch: {explanation}")
+        logger.info("❓ Intent mismatch: %s", explanation)
 
         message = f'Is this part of "{intent}"?'
         if self._notification:
@@ -372,14 +485,14 @@ class OpenSatiApp:
 
     def _on_intent_set(self, intent: str) -> None:
         """Handle intent being set."""
-        print(f"🎯 Intent: {intent}")
+        logger.info("🎯 Intent: %s", intent)
 
         if self._intent_checker:
             self._intent_checker.set_intent(intent)
 
     def _on_intent_clear(self) -> None:
         """Handle intent being cleared."""
-        print("🎯 Intent cleared")
+        logger.info("🎯 Intent cleared")
 
         if self._intent_checker:
             self._intent_checker.clear_intent()
@@ -387,7 +500,7 @@ class OpenSatiApp:
     def _show_settings(self) -> None:
         """Show settings window."""
         if self._settings_window and self._root:
-            self._root.after(0, self._settings_window.show)
+            call_on_tk(self._root, self._settings_window.show)
 
     def _show_intent_bar(self) -> None:
         """Show intent input bar."""
@@ -397,11 +510,11 @@ class OpenSatiApp:
                 state = self._intent_checker.get_state()
                 current = state.current_intent
 
-            self._root.after(0, lambda: self._intent_bar.show(current))
+            call_on_tk(self._root, lambda: self._intent_bar.show(current))
 
     def _on_settings_save(self, settings: Settings) -> None:
         """Handle settings being saved."""
-        print("⚙️ Settings saved")
+        logger.info("⚙️ Settings saved")
         self.settings = settings
 
         # Update detector threshold
@@ -412,18 +525,39 @@ class OpenSatiApp:
         """Toggle monitoring pause."""
         if self._tray:
             if self._tray.is_paused:
-                print("⏸️ Monitoring paused")
+                logger.info("⏸️ Monitoring paused")
                 self._update_widget_state("paused")
             else:
-                print("▶️ Monitoring resumed")
+                logger.info("▶️ Monitoring resumed")
                 self._update_widget_state("active")
 
     def _quit(self) -> None:
-        """Quit the application."""
+        """
+        Quit the application.
+
+        Tears down tk so mainloop returns and the interpreter exits
+        normally, running atexit handlers.
+        """
+        # Tk may only be torn down from its own thread (the tray calls in
+        # from another one)
+        if self._root and threading.current_thread() is not threading.main_thread():
+            self._root.after(0, self._quit)
+            return
+
+        if not self._running:
+            return
+
         print("\n👋 Shutting down OpenSati...")
 
         self._running = False
 
+        if self._root and self._tick_id:
+            self._root.after_cancel(self._tick_id)
+            self._tick_id = None
+
+        # Let an in-flight capture finish before tk goes away
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
         # Stop components
         if self._detector:
             self._detector.stop()
@@ -434,16 +568,22 @@ class OpenSatiApp:
         if self._intent_checker:
             self._intent_checker.stop()
 
+            from opensati.ai.ollama_client import get_scheduler
+
+            get_scheduler().shutdown()
+
         if self._tray:
             self._tray.stop()
 
         if self._grayscale and self._grayscale.is_active():
             self._grayscale.restore()
 
+        if self._settings_window:
+            self._settings_window.dispose()
+
         # Destroy root window
         if self._root:
             self._root.quit()
             self._root.destroy()
 
         print("✅ Goodbye!")
-        sys.exit(0)
@@ -2,35 +2,69 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field, fields
+from functools import cache
 from pathlib import Path
 
-import yaml
+# Config file names in order of preference (JSON loads without importing PyYAML)
+CONFIG_NAMES = ("config.json", "config.yaml")
 
 
+@cache
 def get_config_path() -> Path:
-    """Get the path to config.yaml, checking multiple locations."""
-    # Check current directory first
-    local_config = Path("config.yaml")
-    if local_config.exists():
-        return local_config
-
-    # Check user's home directory
-    home_config = Path.home() / ".opensati" / "config.yaml"
-    if home_config.exists():
-        return home_config
-
-    # Check package directory
-    package_dir = Path(__file__).parent.parent.parent.parent
-    package_config = package_dir / "config.yaml"
-    if package_config.exists():
-        return package_config
+    """
+    Get the path to the config file, checking multiple locations.
+
+    The lookup is cached; reload_settings() clears it.
+    """
+    search_dirs = [
+        # Check current directory first
+        Path("."),
+        # Check user's home directory
+        Path.home() / ".opensati",
+        # Check package directory
+        Path(__file__).parent.parent.parent.parent,
+    ]
+
+    for directory in search_dirs:
+        for name in CONFIG_NAMES:
+            config = directory / name
+            if config.exists():
+                return config
 
     # Return default (will create if needed)
-    return local_config
+    return Path("config.yaml")
 
 
-@dataclass
+def _read_config(path: Path) -> dict:
+    """Read a JSON or YAML config file into a dict."""
+    with open(path) as f:
+        if path.suffix == ".json":
+            return json.load(f) or {}
+
+        import yaml
+
+        # Use the libyaml C loader when available
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        return yaml.load(f, Loader=loader) or {}
+
+
+def _dump_config(data: dict, path: Path) -> str:
+    """Serialize config data as JSON or YAML, by file extension."""
+    if path.suffix == ".json":
+        return json.dumps(data, indent=2)
+
+    import yaml
+
+    # Use the libyaml C dumper when available
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False)
+
+
+@dataclass(slots=True)
 class SensorConfig:
     """Configuration for sensor modules."""
 
@@ -41,7 +75,7 @@ class SensorConfig:
     microphone: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionConfig:
     """Configuration for stress detection."""
 
@@ -51,7 +85,7 @@ class DetectionConfig:
     baseline_window: int = 1800
 
 
-@dataclass
+@dataclass(slots=True)
 class BreathingConfig:
     """Configuration for breathing analysis."""
 
@@ -60,16 +94,17 @@ class BreathingConfig:
     analysis_window: int = 60
 
 
-@dataclass
+@dataclass(slots=True)
 class PostureConfig:
     """Configuration for posture detection."""
 
     neck_angle_threshold: int = 15
     check_interval: int = 10
     blur_intensity: float = 0.7
+    face_model: str = ""  # Path to a YuNet ONNX face model; empty = Haar cascade
 
 
-@dataclass
+@dataclass(slots=True)
 class IntentConfig:
     """Configuration for intent-reality checking."""
 
@@ -77,7 +112,7 @@ class IntentConfig:
     mismatch_threshold: int = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class InterventionConfig:
     """Configuration for interventions."""
 
@@ -87,7 +122,7 @@ class InterventionConfig:
     cooldown: int = 120
 
 
-@dataclass
+@dataclass(slots=True)
 class AIConfig:
     """Configuration for local AI."""
 
@@ -96,23 +131,24 @@ class AIConfig:
     timeout: int = 10
 
 
-@dataclass
+_DEFAULT_MEETING_APPS: tuple[str, ...] = (
+    "zoom.us",
+    "Microsoft Teams",
+    "Slack",
+    "Google Meet",
+    "FaceTime",
+)
+
+
+@dataclass(slots=True)
 class MeetingConfig:
     """Configuration for meeting detection."""
 
-    apps: list[str] = field(
-        default_factory=lambda: [
-            "zoom.us",
-            "Microsoft Teams",
-            "Slack",
-            "Google Meet",
-            "FaceTime",
-        ]
-    )
+    apps: list[str] = field(default_factory=lambda: list(_DEFAULT_MEETING_APPS))
     decompression_duration: int = 60
 
 
-@dataclass
+@dataclass(slots=True)
 class PrivacyConfig:
     """Privacy settings (read-only enforced)."""
 
@@ -121,7 +157,7 @@ class PrivacyConfig:
     network_requests: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Main settings container."""
 
@@ -135,9 +171,14 @@ class Settings:
     meeting: MeetingConfig = field(default_factory=MeetingConfig)
     privacy: PrivacyConfig = field(default_factory=PrivacyConfig)
 
+    # (path, content digest) of the last save
+    _saved: tuple[Path, bytes] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def load(cls, path: Path | None = None) -> Settings:
-        """Load settings from YAML file."""
+        """Load settings from a YAML or JSON file."""
         if path is None:
             path = get_config_path()
 
@@ -147,33 +188,18 @@ class Settings:
             return settings
 
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f) or {}
-
-            # Update each section if present
-            if "sensors" in data:
-                settings.sensors = SensorConfig(**data["sensors"])
-            if "detection" in data:
-                settings.detection = DetectionConfig(**data["detection"])
-            if "breathing" in data:
-                settings.breathing = BreathingConfig(**data["breathing"])
-            if "posture" in data:
-                settings.posture = PostureConfig(**data["posture"])
-            if "intent" in data:
-                settings.intent = IntentConfig(**data["intent"])
-            if "intervention" in data:
-                settings.intervention = InterventionConfig(**data["intervention"])
-            if "ai" in data:
-                settings.ai = AIConfig(**data["ai"])
-            if "meeting" in data:
-                meeting_data = data["meeting"]
-                # Handle 'apps' key which might be in root of meeting section
-                settings.meeting = MeetingConfig(
-                    apps=meeting_data.get("apps", MeetingConfig().apps),
-                    decompression_duration=meeting_data.get(
-                        "decompression_duration", 60
-                    ),
-                )
+            data = _read_config(path)
+
+            # Update each section if present, ignoring unknown keys
+            for key, section_cls in _SECTIONS.items():
+                raw = data.get(key)
+                if raw:
+                    valid = _section_fields(section_cls)
+                    setattr(
+                        settings,
+                        key,
+                        section_cls(**{k: v for k, v in raw.items() if k in valid}),
+                    )
 
         except Exception as e:
             print(f"Warning: Could not load config from {path}: {e}")
@@ -181,41 +207,58 @@ class Settings:
         return settings
 
     def save(self, path: Path | None = None) -> None:
-        """Save settings to YAML file."""
+        """Save settings to a YAML or JSON file (by extension)."""
+        self.write(self.to_dict(), path)
+
+    def to_dict(self) -> dict:
+        """Snapshot every loadable section, so save/load round-trips (privacy is fixed)."""
+        return {key: asdict(getattr(self, key)) for key in _SECTIONS}
+
+    def write(self, data: dict, path: Path | None = None) -> None:
+        """
+        Write a to_dict() snapshot to a YAML or JSON file (by extension).
+
+        Only touches the snapshot, so it can run off the thread that edits
+        the settings.
+        """
         if path is None:
             path = get_config_path()
 
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = {
-            "sensors": {
-                "keyboard": self.sensors.keyboard,
-                "mouse": self.sensors.mouse,
-                "screen": self.sensors.screen,
-                "webcam": self.sensors.webcam,
-                "microphone": self.sensors.microphone,
-            },
-            "detection": {
-                "stress_threshold": self.detection.stress_threshold,
-                "velocity_multiplier": self.detection.velocity_multiplier,
-                "tab_switch_limit": self.detection.tab_switch_limit,
-                "baseline_window": self.detection.baseline_window,
-            },
-            "intervention": {
-                "style": self.intervention.style,
-                "fade_duration": self.intervention.fade_duration,
-                "recovery_method": self.intervention.recovery_method,
-                "cooldown": self.intervention.cooldown,
-            },
-            "ai": {
-                "model": self.ai.model,
-                "vision_model": self.ai.vision_model,
-                "timeout": self.ai.timeout,
-            },
-        }
-
-        with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False)
+        blob = _dump_config(data, path).encode()
+
+        # Skip rewriting identical content
+        digest = hashlib.blake2b(blob, digest_size=16).digest()
+        if self._saved == (path, digest) and path.exists():
+            return
+
+        # Write to a temp file and swap it in, so a crash can't leave a
+        # half-written config
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(blob)
+        os.replace(tmp_path, path)
+
+        self._saved = (path, digest)
+
+
+# Config file section -> dataclass
+_SECTIONS: dict[str, type] = {
+    "sensors": SensorConfig,
+    "detection": DetectionConfig,
+    "breathing": BreathingConfig,
+    "posture": PostureConfig,
+    "intent": IntentConfig,
+    "intervention": InterventionConfig,
+    "ai": AIConfig,
+    "meeting": MeetingConfig,
+}
+
+
+@cache
+def _section_fields(section_cls: type) -> frozenset[str]:
+    """Get the field names of a config section dataclass."""
+    return frozenset(f.name for f in fields(section_cls))
 
 
 # Global settings instance
@@ -233,5 +276,6 @@ def get_settings() -> Settings:
 def reload_settings() -> Settings:
     """Force reload settings from disk."""
     global _settings
+    get_config_path.cache_clear()  # Pick up a moved or newly created config
     _settings = Settings.load()
     return _settings
@@ -12,13 +12,44 @@ Privacy: Titles logged locally only, never sent anywhere.
 from __future__ import annotations
 
 import platform
+import threading
 import time
-from collections import defaultdict
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
-from typing import Callable
+from types import MappingProxyType
+from typing import Final
 
+_IS_DARWIN: Final[bool] = platform.system() == "Darwin"
 
-@dataclass
+# Imported once here rather than on every poll
+if _IS_DARWIN:
+    try:
+        import objc
+        from AppKit import NSWorkspace
+        from Quartz import (
+            CGWindowListCopyWindowInfo,
+            kCGNullWindowID,
+            kCGWindowLayer,
+            kCGWindowListOptionOnScreenOnly,
+            kCGWindowName,
+            kCGWindowOwnerPID,
+        )
+    except ImportError:
+        pass
+    
+    try:
+        from ApplicationServices import (
+            AXUIElementCopyAttributeValue,
+            AXUIElementCreateApplication,
+            kAXErrorSuccess,
+            kAXFocusedWindowAttribute,
+            kAXTitleAttribute,
+        )
+    except ImportError:
+        AXUIElementCreateApplication = None
+
+
+@dataclass(slots=True)
 class ActivityState:
     """Current activity state."""
     
@@ -27,11 +58,19 @@ class ActivityState:
     bundle_id: str = ""
     
     # Usage stats
-    usage_by_app: dict[str, float] = field(default_factory=dict)
     current_app_duration: float = 0.0
+    _usage: Mapping[str, float] = field(default_factory=dict, repr=False)  # Read-only view
+    
+    @property
+    def usage_by_app(self) -> dict[str, float]:
+        """Time per app in seconds, including the current app's live duration."""
+        usage = dict(self._usage)
+        if self.app_name:
+            usage[self.app_name] = usage.get(self.app_name, 0) + self.current_app_duration
+        return usage
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityMonitor:
     """
     Monitors active application and window title.
@@ -55,21 +94,36 @@ class ActivityMonitor:
     _current_title: str = ""
     _current_bundle: str = ""
     _app_start_time: float = 0.0
-    _usage_by_app: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    # Replaced, never mutated, so readers can use it without locking
+    _usage_by_app: dict[str, float] = field(default_factory=dict)
+    _usage_lock: threading.Lock = field(default_factory=threading.Lock)
     _running: bool = False
+    _workspace: object | None = None  # Cached NSWorkspace.sharedWorkspace()
+    _ax_elements: dict[int, object] = field(default_factory=dict)  # pid -> AXUIElement
+    _distracting_lower: tuple[str, ...] = ()
+    _activity_lower: str = ""  # Lowercased "app\0title", updated on change
+    _threshold_secs: float = 0.0
+    _next_alert_at: dict[str, float] = field(default_factory=dict)  # distractor -> seconds
     
     def __post_init__(self):
-        self._usage_by_app = defaultdict(float)
+        self._distracting_lower = tuple(d.lower() for d in self.distracting_apps)
+        self._threshold_secs = self.distraction_threshold_minutes * 60
+        
+        if _IS_DARWIN:
+            try:
+                self._workspace = NSWorkspace.sharedWorkspace()
+            except Exception:
+                self._workspace = None
     
     def start(self) -> bool:
         """Start activity monitoring."""
-        if platform.system() != "Darwin":
+        if not _IS_DARWIN:
             if self.on_log:
                 self.on_log("⚠️ Activity monitor only supports macOS currently")
             return False
         
         self._running = True
-        self._app_start_time = time.time()
+        self._app_start_time = time.monotonic()
         
         # Get initial state
         self._update_state()
@@ -84,8 +138,15 @@ class ActivityMonitor:
         self._running = False
         # Save final duration for current app
         if self._current_app and self._app_start_time:
-            duration = time.time() - self._app_start_time
-            self._usage_by_app[self._current_app] += duration
+            duration = time.monotonic() - self._app_start_time
+            self._add_usage(self._current_app, duration)
+    
+    def _add_usage(self, app_name: str, duration: float) -> None:
+        """Add time to an app's usage by swapping in an updated copy."""
+        with self._usage_lock:
+            usage = dict(self._usage_by_app)
+            usage[app_name] = usage.get(app_name, 0.0) + duration
+            self._usage_by_app = usage
     
     def _get_active_app_mac(self) -> tuple[str, str, str]:
         """
@@ -94,16 +155,15 @@ class ActivityMonitor:
         Returns (app_name, window_title, bundle_id).
         """
         try:
-            from AppKit import NSWorkspace
-            
-            workspace = NSWorkspace.sharedWorkspace()
-            active_app = workspace.frontmostApplication()
-            
-            app_name = active_app.localizedName() or ""
-            bundle_id = active_app.bundleIdentifier() or ""
-            
-            # Try to get window title via Accessibility API
-            window_title = self._get_window_title_mac(active_app)
+            # Drain autoreleased Objective-C objects every poll
+            with objc.autorelease_pool():
+                active_app = self._workspace.frontmostApplication()
+                
+                app_name = active_app.localizedName() or ""
+                bundle_id = active_app.bundleIdentifier() or ""
+                
+                # Try to get window title via Accessibility API
+                window_title = self._get_window_title_mac(active_app)
             
             return (app_name, window_title, bundle_id)
             
@@ -114,18 +174,13 @@ class ActivityMonitor:
     def _get_window_title_mac(self, app) -> str:
         """Get window title using Accessibility API."""
         try:
-            from Quartz import (
-                CGWindowListCopyWindowInfo,
-                kCGWindowListOptionOnScreenOnly,
-                kCGNullWindowID,
-                kCGWindowOwnerPID,
-                kCGWindowName,
-                kCGWindowLayer
-            )
-            
             pid = app.processIdentifier()
             
-            # Get all windows
+            title = self._get_focused_window_title_ax(pid)
+            if title is not None:
+                return title
+            
+            # Fall back to scanning all on-screen windows
             window_list = CGWindowListCopyWindowInfo(
                 kCGWindowListOptionOnScreenOnly,
                 kCGNullWindowID
@@ -145,13 +200,39 @@ class ActivityMonitor:
         except Exception:
             return ""
     
+    def _get_focused_window_title_ax(self, pid: int) -> str | None:
+        """
+        Get the focused window's title of one process via AX.
+        
+        Queries a single window instead of listing every on-screen window.
+        Returns None if AX is unavailable or denied.
+        """
+        if AXUIElementCreateApplication is None:
+            return None
+        
+        element = self._ax_elements.get(pid)
+        if element is None:
+            if len(self._ax_elements) >= 64:
+                self._ax_elements.clear()  # Drop elements of exited apps
+            element = self._ax_elements[pid] = AXUIElementCreateApplication(pid)
+        
+        err, window = AXUIElementCopyAttributeValue(element, kAXFocusedWindowAttribute, None)
+        if err != kAXErrorSuccess or window is None:
+            return None
+        
+        err, title = AXUIElementCopyAttributeValue(window, kAXTitleAttribute, None)
+        if err != kAXErrorSuccess:
+            return None
+        
+        return title or ""
+    
     def _update_state(self) -> bool:
         """
         Update current activity state.
         
         Returns True if app changed.
         """
-        if platform.system() == "Darwin":
+        if _IS_DARWIN:
             app_name, title, bundle = self._get_active_app_mac()
         else:
             return False
@@ -161,8 +242,8 @@ class ActivityMonitor:
         
         if app_changed and self._current_app:
             # Log duration for previous app
-            duration = time.time() - self._app_start_time
-            self._usage_by_app[self._current_app] += duration
+            duration = time.monotonic() - self._app_start_time
+            self._add_usage(self._current_app, duration)
             
             # Notify about switch
             if self.on_app_switch:
@@ -171,12 +252,16 @@ class ActivityMonitor:
             if self.on_log:
                 self.on_log(f"🔄 Switched to {app_name}: {title[:40]}..." if title else f"🔄 Switched to {app_name}")
         
+        if app_changed or title != self._current_title:
+            self._activity_lower = f"{app_name}\0{title}".lower()
+        
         self._current_app = app_name
         self._current_title = title
         self._current_bundle = bundle
         
         if app_changed:
-            self._app_start_time = time.time()
+            self._app_start_time = time.monotonic()
+            self._next_alert_at.clear()
         
         return app_changed
     
@@ -192,53 +277,56 @@ class ActivityMonitor:
         self._update_state()
         
         # Calculate current app duration
-        current_duration = time.time() - self._app_start_time if self._app_start_time else 0
+        current_duration = time.monotonic() - self._app_start_time if self._app_start_time else 0
         
         # Check for distraction
         self._check_distraction(current_duration)
         
-        # Build usage dict (copy with current app's live duration)
-        usage = dict(self._usage_by_app)
-        if self._current_app:
-            usage[self._current_app] = usage.get(self._current_app, 0) + current_duration
-        
+        # Usage is a read-only view of an immutable snapshot; the live
+        # duration is added on access
         return ActivityState(
             app_name=self._current_app,
             window_title=self._current_title,
             bundle_id=self._current_bundle,
-            usage_by_app=usage,
-            current_app_duration=current_duration
+            current_app_duration=current_duration,
+            _usage=MappingProxyType(self._usage_by_app),
         )
     
+    def get_active_window(self) -> tuple[str, str]:
+        """
+        Get the last seen (app_name, window_title).
+        
+        Cheap: returns the state from the most recent check().
+        """
+        return (self._current_app, self._current_title)
+    
     def _check_distraction(self, duration: float):
         """Check if user is distracted and log warning."""
-        if not self.on_log:
-            return
+        if not self.on_log or self._threshold_secs <= 0:
+            return  # No one to tell, or alerts disabled (threshold of 0)
         
         # Check if current app is in distracting list
-        for distractor in self.distracting_apps:
-            if distractor.lower() in self._current_app.lower() or \
-               distractor.lower() in self._current_title.lower():
-                
-                minutes = duration / 60
-                if minutes >= self.distraction_threshold_minutes:
-                    # Only log once per threshold crossing (every 5 min increment)
-                    if int(minutes) % self.distraction_threshold_minutes == 0 and \
-                       int(minutes * 60) % 300 < 2:  # Within 2 seconds of threshold
-                        self.on_log(f"⚠️ {int(minutes)} min on {distractor}")
+        for distractor, lowered in zip(self.distracting_apps, self._distracting_lower):
+            if lowered in self._activity_lower:
+                # Log once per threshold crossing (every 5 min increment)
+                next_at = self._next_alert_at.get(distractor, self._threshold_secs)
+                if duration >= next_at:
+                    crossed = duration - duration % self._threshold_secs
+                    self._next_alert_at[distractor] = crossed + self._threshold_secs
+                    self.on_log(f"⚠️ {int(crossed // 60)} min on {distractor}")
                 break
     
     def get_usage_summary(self) -> str:
         """Get a formatted summary of app usage."""
         # Get current stats
-        state = self.check()
+        usage = self.check().usage_by_app
         
-        if not state.usage_by_app:
+        if not usage:
             return "No usage data yet"
         
         # Sort by duration
         sorted_usage = sorted(
-            state.usage_by_app.items(),
+            usage.items(),
             key=lambda x: x[1],
             reverse=True
         )[:5]  # Top 5
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-import threading
 from collections.abc import Callable
 from dataclasses import dataclass, field
 
 import numpy as np
 
+# Audio samples per breathing-envelope point
+_DOWNSAMPLE = 100
 
-@dataclass
+# RMS of the newest audio below which the room counts as silent
+_SILENCE_RMS = 1e-4
+
+
+@dataclass(slots=True)
 class BreathingState:
     """Current breathing analysis state."""
 
@@ -45,14 +50,21 @@ class AudioSensor:
     # Internal state
     _running: bool = False
     _stream = None
-    _audio_buffer: list = field(default_factory=list)
-    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _buf: np.ndarray = field(init=False, repr=False)  # Ring of the last analysis_window seconds
+    _env: np.ndarray = field(init=False, repr=False)  # One envelope point per ring block
+    _bp_sos: np.ndarray | None = None  # Breathing-band filter, built on first analysis
+    _wpos: int = 0  # Next write offset into _buf
+    _filled: int = 0  # Samples written so far, capped at len(_buf)
     _last_rate: float = 0.0
 
     def __post_init__(self) -> None:
         """Initialize internal state."""
-        self._audio_buffer = []
-        self._lock = threading.Lock()
+        # Round the ring up to whole envelope blocks so it can be decimated
+        # as a (blocks, _DOWNSAMPLE) view without copying
+        size = self.sample_rate * self.analysis_window
+        size += -size % _DOWNSAMPLE
+        self._buf = np.zeros(size, dtype=np.float32)
+        self._env = np.empty(size // _DOWNSAMPLE, dtype=np.float32)
 
     def start(self) -> bool:
         """
@@ -109,16 +121,31 @@ class AudioSensor:
         if not self._running:
             return (None, pyaudio.paComplete)
 
-        # Convert to numpy array
-        audio_data = np.frombuffer(in_data, dtype=np.float32)
-
-        with self._lock:
-            self._audio_buffer.append(audio_data)
-
-            # Keep only last N seconds
-            max_chunks = (self.sample_rate * self.analysis_window) // self.chunk_size
-            if len(self._audio_buffer) > max_chunks:
-                self._audio_buffer = self._audio_buffer[-max_chunks:]
+        # View PyAudio's bytes as mono float32 samples. The view is copied
+        # into the ring below and never kept, so the bytes can be freed as
+        # soon as this callback returns.
+        audio_data = np.frombuffer(in_data, dtype=np.float32, count=frame_count)
+
+        buf = self._buf
+        size = buf.shape[0]
+        if audio_data.shape[0] > size:
+            audio_data = audio_data[-size:]
+        n = audio_data.shape[0]
+
+        # Single producer: this callback is the only writer, so it never
+        # takes a lock. Copy into the ring (splitting the write when it
+        # wraps), then publish the write position before the fill count so
+        # a reader that sees the new count also sees the new position.
+        start = self._wpos
+        end = start + n
+        if end <= size:
+            buf[start:end] = audio_data
+        else:
+            split = size - start
+            np.copyto(buf[start:], audio_data[:split])
+            np.copyto(buf[: end - size], audio_data[split:])
+        self._wpos = end % size
+        self._filled = min(self._filled + n, size)
 
         return (None, pyaudio.paContinue)
 
@@ -128,30 +155,52 @@ class AudioSensor:
 
         Returns (breaths_per_minute, confidence).
         """
-        with self._lock:
-            if len(self._audio_buffer) < 10:
-                return (0.0, 0.0)
-
-            # Concatenate audio
-            audio = np.concatenate(self._audio_buffer)
+        # Snapshot the fill count, then the write position (the reverse of
+        # the order the callback publishes them) and read without locking.
+        # The callback may overwrite the oldest few samples mid-read, which
+        # is harmless for a minute-long envelope.
+        filled = self._filled
+        wpos = self._wpos
+        if filled < 10 * self.chunk_size:
+            return (0.0, 0.0)
 
-        # Get amplitude envelope (low-pass filtered)
-        envelope = np.abs(audio)
+        # Nothing to analyse if the last two seconds are silent
+        if self._recent_rms(wpos, min(2 * self.sample_rate, filled)) < _SILENCE_RMS:
+            return (0.0, 0.0)
 
-        # Downsample for efficiency
-        downsample = 100
-        envelope = envelope[::downsample]
+        # Max-pool |audio| over each ring block into the preallocated
+        # envelope (as max(max, -min), so no full-length abs is allocated),
+        # then put the blocks in time order. Once the ring has wrapped, the
+        # oldest block is the first one at or after the write position;
+        # before that, only fully written blocks count.
+        blocks = self._buf.reshape(-1, _DOWNSAMPLE)
+        env = self._env
+        blocks.min(axis=1, out=env)
+        np.negative(env, out=env)
+        np.maximum(env, blocks.max(axis=1), out=env)
+        if filled == self._buf.shape[0]:
+            oldest = -(-wpos // _DOWNSAMPLE)
+            envelope = np.concatenate((self._env[oldest:], self._env[:oldest]))
+        else:
+            envelope = self._env[: filled // _DOWNSAMPLE]
 
         if len(envelope) < 100:
             return (0.0, 0.0)
 
-        # Find peaks in envelope (breathing cycles)
-        from scipy.signal import find_peaks
+        from scipy.signal import butter, find_peaks, sosfiltfilt
 
-        # Expected breathing: 8-20 per minute = 0.13-0.33 Hz
-        # With our sample rate and downsampling, peaks should be spaced accordingly
-        min_distance = int((self.sample_rate / downsample) * (60 / self.max_rate))
-        peaks, properties = find_peaks(envelope, distance=min_distance, prominence=0.01)
+        # Keep only the breathing band (0.1-0.5 Hz = 6-30 per minute) so
+        # speech onsets, heartbeat and hum don't show up as peaks
+        if self._bp_sos is None:
+            self._bp_sos = butter(
+                4, [0.1, 0.5], btype="band", fs=self.sample_rate / _DOWNSAMPLE, output="sos"
+            )
+        envelope = sosfiltfilt(self._bp_sos, envelope)
+
+        # Find peaks in envelope (breathing cycles). The filter already
+        # bounds how close breaths can be, so no distance gate is needed
+        # (one at max_rate made faster, stressed breathing undetectable).
+        peaks, _ = find_peaks(envelope, prominence=0.01)
 
         if len(peaks) < 2:
             return (0.0, 0.0)
@@ -159,7 +208,7 @@ class AudioSensor:
         # Calculate rate from peak intervals
         intervals = np.diff(peaks)
         avg_interval = np.mean(intervals)
-        samples_per_breath = avg_interval * downsample
+        samples_per_breath = avg_interval * _DOWNSAMPLE
         seconds_per_breath = samples_per_breath / self.sample_rate
         breaths_per_minute = 60 / seconds_per_breath
 
@@ -169,6 +218,15 @@ class AudioSensor:
 
         return (breaths_per_minute, confidence)
 
+    def _recent_rms(self, wpos: int, count: int) -> float:
+        """RMS of the newest ``count`` samples, which end at ``wpos``."""
+        if wpos >= count:
+            views = (self._buf[wpos - count : wpos],)
+        else:
+            views = (self._buf[:wpos], self._buf[self._buf.shape[0] - (count - wpos) :])
+        energy = sum(float(np.dot(v, v)) for v in views)
+        return (energy / count) ** 0.5
+
     def get_state(self) -> BreathingState:
         """Get current breathing state."""
         if not self._running:
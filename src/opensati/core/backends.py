@@ -0,0 +1,20 @@
+"""Availability of the libraries behind each sensor."""
+
+from __future__ import annotations
+
+from functools import cache
+from importlib.util import find_spec
+
+# Sensor -> modules it needs. Keyboard and mouse are absent on purpose:
+# they have per-platform fallbacks (Quartz, evdev) besides pynput.
+_SENSOR_MODULES: dict[str, tuple[str, ...]] = {
+    "screen": ("mss",),
+    "webcam": ("cv2",),
+    "microphone": ("pyaudio", "scipy"),
+}
+
+
+@cache
+def backend_available(sensor: str) -> bool:
+    """Check whether a sensor's libraries are installed (without importing them)."""
+    return all(find_spec(module) is not None for module in _SENSOR_MODULES.get(sensor, ()))
@@ -20,7 +20,11 @@ class StressLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Levels that trigger an intervention
+_ALERT_LEVELS = (StressLevel.HIGH, StressLevel.CRITICAL)
+
+
+@dataclass(slots=True)
 class DetectorState:
     """Current detector state."""
 
@@ -52,7 +56,7 @@ class StressDetector:
 
     # Internal state
     _input_sensor: InputSensor | None = None
-    _last_intervention_time: float = 0.0
+    _last_intervention_time: float = float("-inf")  # time.monotonic()
     _current_level: StressLevel = StressLevel.CALM
 
     def __post_init__(self) -> None:
@@ -80,7 +84,7 @@ class StressDetector:
 
     def get_state(self) -> DetectorState:
         """Get current detector state."""
-        now = time.time()
+        now = time.monotonic()
         cooldown = self.settings.intervention.cooldown
         can_intervene = (now - self._last_intervention_time) > cooldown
 
@@ -124,6 +128,13 @@ class StressDetector:
 
         Returns True if intervention was triggered.
         """
+        # While cooling down no intervention can fire, and calm can only be
+        # restored from an alert level, so skip polling the sensors
+        cooldown = self.settings.intervention.cooldown
+        in_cooldown = time.monotonic() - self._last_intervention_time <= cooldown
+        if in_cooldown and self._current_level not in _ALERT_LEVELS:
+            return False
+
         state = self.get_state()
 
         # Track state changes
@@ -131,14 +142,14 @@ class StressDetector:
         self._current_level = state.level
 
         # Callback for calm restored
-        if previous_level in (StressLevel.HIGH, StressLevel.CRITICAL):
+        if previous_level in _ALERT_LEVELS:
             if state.level == StressLevel.CALM and self.on_calm_restored:
                 self.on_calm_restored()
 
         # Check if intervention is needed and allowed
-        if state.level in (StressLevel.HIGH, StressLevel.CRITICAL):
+        if state.level in _ALERT_LEVELS:
             if state.can_intervene:
-                self._last_intervention_time = time.time()
+                self._last_intervention_time = time.monotonic()
                 if self.on_stress_detected:
                     self.on_stress_detected(state.level, state.score)
                 return True
@@ -0,0 +1,175 @@
+"""
+Linux input monitoring straight from evdev devices.
+
+Reads kernel input events from /dev/input/event* instead of going through
+pynput's X11 dispatch. Needs read access to those devices (usually membership
+of the ``input`` group); callers fall back to pynput when none are readable.
+Only event timing/count is reported, never key content.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import glob
+import os
+import select
+import struct
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+# struct input_event: timeval, type, code, value
+_EVENT = struct.Struct("llHHi")
+
+EV_KEY = 0x01
+EV_REL = 0x02
+EV_ABS = 0x03
+REL_X = 0x00
+REL_Y = 0x01
+ABS_X = 0x00
+ABS_Y = 0x01
+BTN_MISC = 0x100  # Key codes below this are keyboard keys
+BTN_MOUSE = 0x110
+BTN_TASK = 0x117  # Last mouse button code
+BTN_TOUCH = 0x14A  # Finger on a touchpad or touchscreen
+
+# ioctl reading a device's 32-bit property mask, and the touchscreen bit in it
+_EVIOCGPROP = (2 << 30) | (4 << 16) | (ord("E") << 8) | 0x09
+INPUT_PROP_DIRECT = 0x01
+
+
+def _is_direct(fd: int) -> bool:
+    """Check if a device is a touchscreen (touches land where they point)."""
+    props = bytearray(4)
+    try:
+        fcntl.ioctl(fd, _EVIOCGPROP, props)
+    except OSError:
+        return False
+    return bool(int.from_bytes(props, "little") & (1 << INPUT_PROP_DIRECT))
+
+
+@dataclass(slots=True)
+class _Device:
+    """An open evdev device and where its current touch is."""
+
+    fd: int
+    direct: bool = False  # Touchscreen: a touch is a click
+    abs_x: int | None = None  # Last absolute position; None between touches
+    abs_y: int | None = None
+
+
+@dataclass
+class LinuxInputMonitor:
+    """Forward keyboard/mouse activity from evdev devices (Linux only)."""
+
+    # Callbacks, matching InputSensor's pynput handlers
+    on_key: Callable[[object], None] | None = None
+    on_click: Callable[[int, int, object, bool], None] | None = None
+    on_move: Callable[[int, int], None] | None = None
+
+    # Internal state
+    _stop_event: threading.Event | None = None  # Owned by the current reader
+    _thread: threading.Thread | None = None
+    _x: int = 0  # Pointer position integrated from relative motion
+    _y: int = 0
+
+    def start(self) -> bool:
+        """Start monitoring. Returns True if any input device could be read."""
+        if self._stop_event is not None:
+            return True
+
+        devices: list[_Device] = []
+        for path in sorted(glob.glob("/dev/input/event*")):
+            try:
+                fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+            except OSError:
+                continue  # No permission, or device went away
+            devices.append(_Device(fd, _is_direct(fd)))
+
+        if not devices:
+            return False
+
+        # Each reader gets its own devices and stop event, so one still
+        # waking from select() after stop() never shares them with the next
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(devices, self._stop_event), daemon=True
+        )
+        self._thread.start()
+
+        print("🎹 Input monitoring started (evdev)")
+        return True
+
+    def stop(self) -> None:
+        """Stop monitoring; the reader thread closes the devices."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+            self._stop_event = None
+        self._thread = None
+
+    def _run(self, devices: list[_Device], stop_event: threading.Event) -> None:
+        """Wait on all devices and dispatch their events."""
+        by_fd = {device.fd: device for device in devices}
+        try:
+            while not stop_event.is_set():
+                ready, _, _ = select.select(list(by_fd), [], [], 0.5)
+                for fd in ready:
+                    try:
+                        data = os.read(fd, _EVENT.size * 64)
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        # Device unplugged
+                        del by_fd[fd]
+                        os.close(fd)
+                        continue
+                    self._dispatch(data, by_fd[fd])
+        finally:
+            for fd in by_fd:
+                os.close(fd)
+
+    def _dispatch(self, data: bytes, device: _Device | None = None) -> None:
+        """
+        Turn raw events into key/click/move callbacks (codes are not kept).
+
+        Touchpads and touchscreens report absolute positions; their deltas
+        within one touch count as motion, the jump to a new touch doesn't.
+        Touchscreen touches count as clicks. Touchpad taps don't: tapping
+        to click is done by libinput, above evdev.
+        """
+        dx = dy = 0
+        usable = len(data) - len(data) % _EVENT.size
+        for _, _, ev_type, code, value in _EVENT.iter_unpack(data[:usable]):
+            if ev_type == EV_KEY and code == BTN_TOUCH:
+                if device is None:
+                    continue
+                if value == 0:
+                    device.abs_x = device.abs_y = None  # Finger lifted
+                elif value == 1 and device.direct and self.on_click:
+                    self.on_click(self._x, self._y, None, True)
+            elif ev_type == EV_KEY and value == 1:
+                if code < BTN_MISC:
+                    if self.on_key:
+                        self.on_key(None)
+                elif BTN_MOUSE <= code <= BTN_TASK and self.on_click:
+                    self.on_click(self._x, self._y, None, True)
+            elif ev_type == EV_REL:
+                if code == REL_X:
+                    dx += value
+                elif code == REL_Y:
+                    dy += value
+            elif ev_type == EV_ABS and device is not None:
+                if code == ABS_X:
+                    if device.abs_x is not None:
+                        dx += value - device.abs_x
+                    device.abs_x = value
+                elif code == ABS_Y:
+                    if device.abs_y is not None:
+                        dy += value - device.abs_y
+                    device.abs_y = value
+
+        # One move per read batch; InputSensor rate-limits further
+        if (dx or dy) and self.on_move:
+            self._x += dx
+            self._y += dy
+            self.on_move(self._x, self._y)
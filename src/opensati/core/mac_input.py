@@ -9,9 +9,10 @@ from __future__ import annotations
 
 import threading
 import time
-from collections import deque
 from dataclasses import dataclass, field
 
+from opensati.core.ring import EventRing
+
 
 @dataclass
 class MacInputMonitor:
@@ -20,14 +21,12 @@ class MacInputMonitor:
     window_size: float = 10.0
     
     # Internal state
-    _event_times: deque = field(default_factory=lambda: deque(maxlen=500))
+    _event_times: EventRing = field(default_factory=lambda: EventRing(512))
     _running: bool = False
     _thread: threading.Thread | None = None
-    _lock: threading.Lock = field(default_factory=threading.Lock)
     
     def __post_init__(self):
-        self._event_times = deque(maxlen=500)
-        self._lock = threading.Lock()
+        self._event_times = EventRing(512)
     
     def start(self) -> bool:
         """Start monitoring. Returns True if successful."""
@@ -49,8 +48,8 @@ class MacInputMonitor:
         
         def callback(proxy, event_type, event, refcon):
             """Record event timestamp (not content)."""
-            with self._lock:
-                self._event_times.append(time.time())
+            # Runs on the event tap thread: the ring's single writer, so no lock
+            self._event_times.append(time.monotonic())
             return event
         
         # Create event tap for keyboard and mouse
@@ -97,12 +96,10 @@ class MacInputMonitor:
         
     def get_events_per_second(self) -> float:
         """Get input events per second in the window."""
-        now = time.time()
+        now = time.monotonic()
         window_start = now - self.window_size
         
-        with self._lock:
-            recent = sum(1 for t in self._event_times if t > window_start)
-        
+        recent = self._event_times.count_since(window_start)
         return recent / self.window_size
     
     def get_intensity(self) -> float:
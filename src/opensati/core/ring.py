@@ -0,0 +1,66 @@
+"""Fixed-size timestamp ring shared by the input sensors."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class EventRing:
+    """
+    Ring of event timestamps in arrival order.
+
+    Timestamps must be appended in non-decreasing order (they come from a
+    clock), so each contiguous segment of the ring is sorted and window
+    counts reduce to a binary search instead of a scan.
+
+    One writer thread may append while others read without a lock: append
+    fills the slot before advancing ``_head`` (a single attribute store
+    under the GIL), and readers snapshot ``_head`` once. A read racing the
+    writer can at worst see the oldest slot already overwritten.
+    """
+
+    capacity: int = 1024
+
+    # Internal state
+    _times: np.ndarray = field(init=False, repr=False)
+    _head: int = 0  # Total events ever appended
+
+    def __post_init__(self) -> None:
+        """Allocate the timestamp storage."""
+        self._times = np.empty(self.capacity, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return min(self._head, self.capacity)
+
+    def append(self, timestamp: float) -> int:
+        """Record an event. Returns the slot it was written to."""
+        slot = self._head % self.capacity
+        self._times[slot] = timestamp
+        self._head += 1
+        return slot
+
+    def count_since(self, start: float) -> int:
+        """Count events strictly after ``start``."""
+        head = self._head
+        split = head % self.capacity
+        if head <= self.capacity:
+            newer = self._times[:head]
+            return head - int(np.searchsorted(newer, start, side="right"))
+
+        # Wrapped: slots [split:] hold the oldest events, [:split] the newest
+        older = self._times[split:]
+        newer = self._times[:split]
+        return (
+            older.shape[0]
+            - int(np.searchsorted(older, start, side="right"))
+            + split
+            - int(np.searchsorted(newer, start, side="right"))
+        )
+
+    def last_slots(self, count: int) -> np.ndarray:
+        """Slot indices of the most recent ``count`` events, oldest first."""
+        head = self._head
+        return np.arange(head - count, head) % self.capacity
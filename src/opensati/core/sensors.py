@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import threading
 import time
-from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from opensati.core.ring import EventRing
+
 # Lazy import pynput to allow tests to run in headless environments
 _pynput_available = False
 try:
@@ -25,7 +28,7 @@ def is_pynput_available() -> bool:
     return _pynput_available
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorState:
     """Current state of input sensors."""
 
@@ -49,28 +52,35 @@ class InputSensor:
     window_size: float = 10.0  # Seconds to track
     baseline_duration: float = 300.0  # 5 minutes to establish baseline
     stress_threshold: float = 50.0  # Keystrokes per window to trigger
+    move_sample_interval: float = 0.016  # Min seconds between mouse samples (~60 Hz)
 
     # Callbacks
     on_stress_detected: Callable[[float], None] | None = None
 
     # Internal state
-    _keystroke_times: deque = field(default_factory=lambda: deque(maxlen=1000))
-    _click_times: deque = field(default_factory=lambda: deque(maxlen=500))
-    _mouse_positions: deque = field(default_factory=lambda: deque(maxlen=100))
-    _baseline_samples: list = field(default_factory=list)
+    _keystroke_times: EventRing = field(default_factory=lambda: EventRing(1024))
+    _click_times: EventRing = field(default_factory=lambda: EventRing(512))
+    _mouse_times: EventRing = field(default_factory=lambda: EventRing(128))
+    _mouse_xs: np.ndarray = field(init=False, repr=False)  # x per _mouse_times slot
+    _mouse_ys: np.ndarray = field(init=False, repr=False)  # y per _mouse_times slot
+    _baseline_sum: float = 0.0  # Running total of calibration samples
+    _baseline_count: int = 0
     _lock: threading.Lock = field(default_factory=threading.Lock)
     _running: bool = False
     _keyboard_listener: keyboard.Listener | None = None  # type: ignore
     _mouse_listener: mouse.Listener | None = None  # type: ignore
     _mac_monitor: object | None = None
+    _linux_monitor: object | None = None
     _start_time: float = 0.0
+    _last_move_t: float = 0.0
 
     def __post_init__(self) -> None:
-        """Initialize deques after dataclass init."""
-        self._keystroke_times = deque(maxlen=1000)
-        self._click_times = deque(maxlen=500)
-        self._mouse_positions = deque(maxlen=100)
-        self._baseline_samples = []
+        """Initialize event rings after dataclass init."""
+        self._keystroke_times = EventRing(1024)
+        self._click_times = EventRing(512)
+        self._mouse_times = EventRing(128)
+        self._mouse_xs = np.zeros(self._mouse_times.capacity, dtype=np.int32)
+        self._mouse_ys = np.zeros(self._mouse_times.capacity, dtype=np.int32)
         self._lock = threading.Lock()
 
     def start(self) -> None:
@@ -85,20 +95,39 @@ class InputSensor:
                 self._mac_monitor = MacInputMonitor(window_size=self.window_size)
                 if self._mac_monitor.start():
                     self._running = True
-                    self._start_time = time.time()
+                    self._start_time = time.monotonic()
                     print("🎹 Input sensors started (Quartz mode - safe)")
                     return
             except Exception as e:
                 print(f"⚠️ Mac Quartz monitor failed: {e}")
                 # Fallback to pynput if Quartz fails, but it usually works
-        
+
+        if platform.system() == "Linux":
+            try:
+                from opensati.core.linux_input import LinuxInputMonitor
+                self._linux_monitor = LinuxInputMonitor(
+                    on_key=self._on_key_press,
+                    on_click=self._on_mouse_click,
+                    on_move=self._on_mouse_move,
+                )
+                if self._linux_monitor.start():
+                    self._running = True
+                    self._start_time = time.monotonic()
+                    print("🎹 Input sensors started (evdev mode)")
+                    return
+                self._linux_monitor = None
+            except Exception as e:
+                print(f"⚠️ evdev monitor failed: {e}")
+                self._linux_monitor = None
+                # Fallback to pynput (no read access to /dev/input)
+
         # Non-macOS or fallback logic
         if not _pynput_available:
             print("⚠️ pynput not available (headless environment?)")
             return
 
         self._running = True
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
 
         # Try to start listeners
         try:
@@ -126,6 +155,10 @@ class InputSensor:
             self._mac_monitor.stop()
             self._mac_monitor = None
 
+        if self._linux_monitor:
+            self._linux_monitor.stop()
+            self._linux_monitor = None
+
         if self._keyboard_listener:
             self._keyboard_listener.stop()
             self._keyboard_listener = None
@@ -139,18 +172,26 @@ class InputSensor:
     def _on_key_press(self, key) -> None:
         """Record keystroke timing (NOT the actual key)."""
         with self._lock:
-            self._keystroke_times.append(time.time())
+            self._keystroke_times.append(time.monotonic())
 
     def _on_mouse_click(self, x: int, y: int, button, pressed: bool) -> None:
         """Record mouse click timing."""
         if pressed:
             with self._lock:
-                self._click_times.append(time.time())
+                self._click_times.append(time.monotonic())
 
     def _on_mouse_move(self, x: int, y: int) -> None:
         """Record mouse position for velocity calculation."""
+        # Moves arrive at hundreds of Hz; ~60 Hz is plenty for velocity
+        t = time.monotonic()
+        if t - self._last_move_t < self.move_sample_interval:
+            return
+        self._last_move_t = t
+
         with self._lock:
-            self._mouse_positions.append((time.time(), x, y))
+            slot = self._mouse_times.append(t)
+            self._mouse_xs[slot] = x
+            self._mouse_ys[slot] = y
 
     def get_state(self) -> SensorState:
         """Get current sensor state."""
@@ -168,40 +209,38 @@ class InputSensor:
                 is_calibrating=False
             )
 
-        now = time.time()
+        now = time.monotonic()
         window_start = now - self.window_size
         is_calibrating = (now - self._start_time) < self.baseline_duration
 
         with self._lock:
             # Count keystrokes in window
-            recent_keystrokes = sum(
-                1 for t in self._keystroke_times if t > window_start
-            )
+            recent_keystrokes = self._keystroke_times.count_since(window_start)
             keystrokes_per_second = recent_keystrokes / self.window_size
 
             # Count clicks in window
-            recent_clicks = sum(1 for t in self._click_times if t > window_start)
+            recent_clicks = self._click_times.count_since(window_start)
             clicks_per_second = recent_clicks / self.window_size
 
-            # Calculate mouse velocity
+            # Calculate mouse velocity from consecutive positions in window
             mouse_distance = 0.0
-            recent_positions = [
-                (t, x, y) for t, x, y in self._mouse_positions if t > window_start
-            ]
-            for i in range(1, len(recent_positions)):
-                _, x1, y1 = recent_positions[i - 1]
-                _, x2, y2 = recent_positions[i]
-                mouse_distance += ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+            recent_moves = self._mouse_times.count_since(window_start)
+            if recent_moves > 1:
+                slots = self._mouse_times.last_slots(recent_moves)
+                dx = np.diff(self._mouse_xs[slots])
+                dy = np.diff(self._mouse_ys[slots])
+                mouse_distance = float(np.hypot(dx, dy).sum())
             mouse_velocity = mouse_distance / self.window_size
 
             # Update baseline during calibration
             if is_calibrating and recent_keystrokes > 0:
-                self._baseline_samples.append(keystrokes_per_second)
+                self._baseline_sum += keystrokes_per_second
+                self._baseline_count += 1
 
-            # Calculate baseline
+            # Calculate baseline (running mean of calibration samples)
             baseline = 0.0
-            if self._baseline_samples:
-                baseline = sum(self._baseline_samples) / len(self._baseline_samples)
+            if self._baseline_count:
+                baseline = self._baseline_sum / self._baseline_count
 
             # Calculate stress score (0-100)
             stress_score = min(100, (recent_keystrokes / self.stress_threshold) * 100)
@@ -0,0 +1,109 @@
+"""
+Desktop session state: is anyone able to see the screen right now?
+
+Interventions check this before building windows or changing gamma, so no
+work is done while the screen is locked or the session is switched away.
+When the state can't be determined the display is assumed to be active.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import subprocess
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+_SYSTEM = platform.system()
+
+# Access right asked for when opening the input desktop; the lock screen's
+# secure desktop refuses it
+_DESKTOP_SWITCHDESKTOP = 0x0100
+
+# Seconds to reuse logind's answer before refreshing it in the background
+_LINUX_STATE_TTL = 5.0
+
+# loginctl can block for up to its timeout, so it runs here rather than on
+# the Tk thread that asks before showing an overlay
+_SESSION_WORKER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="opensati-session")
+
+_linux_active = True  # Last answer from logind; active until it says otherwise
+_linux_checked_at = float("-inf")
+_linux_refresh: Future | None = None
+
+
+def is_display_active() -> bool:
+    """Return False if the screen is locked or the session is inactive."""
+    try:
+        if _SYSTEM == "Darwin":
+            return _is_active_macos()
+        elif _SYSTEM == "Windows":
+            return _is_active_windows()
+        else:  # Linux
+            return _is_active_linux()
+    except Exception:
+        return True
+
+
+def _is_active_macos() -> bool:
+    """Read the lock flag from the current Quartz session."""
+    from Quartz import CGSessionCopyCurrentDictionary
+
+    session = CGSessionCopyCurrentDictionary()
+    if session is None:
+        return False  # No GUI session (e.g. logged out to the login window)
+    if session.get("CGSSessionScreenIsLocked", False):
+        return False
+    return bool(session.get("kCGSSessionOnConsoleKey", True))
+
+
+def _is_active_windows() -> bool:
+    """The input desktop can't be opened while the lock screen is up."""
+    import ctypes
+
+    user32 = ctypes.windll.user32
+    desktop = user32.OpenInputDesktop(0, False, _DESKTOP_SWITCHDESKTOP)
+    if not desktop:
+        return False
+    user32.CloseDesktop(desktop)
+    return True
+
+
+def _is_active_linux() -> bool:
+    """
+    Return logind's last answer, refreshing it on a worker once stale.
+
+    Never waits for loginctl, so a lock is noticed up to
+    _LINUX_STATE_TTL seconds (plus one query) late.
+    """
+    global _linux_refresh
+    stale = time.monotonic() - _linux_checked_at >= _LINUX_STATE_TTL
+    if stale and (_linux_refresh is None or _linux_refresh.done()):
+        _linux_refresh = _SESSION_WORKER.submit(_refresh_linux_state)
+    return _linux_active
+
+
+def _refresh_linux_state() -> None:
+    """Query logind and store the answer for _is_active_linux()."""
+    global _linux_active, _linux_checked_at
+    try:
+        _linux_active = _query_logind()
+    except Exception:
+        _linux_active = True
+    _linux_checked_at = time.monotonic()
+
+
+def _query_logind() -> bool:
+    """Ask logind whether this session is active and unlocked."""
+    session_id = os.environ.get("XDG_SESSION_ID", "auto")
+    result = subprocess.run(
+        ["loginctl", "show-session", session_id, "-p", "Active", "-p", "LockedHint"],
+        capture_output=True,
+        text=True,
+        timeout=2,
+    )
+    if result.returncode != 0:
+        return True  # No logind session to ask about
+
+    properties = dict(line.split("=", 1) for line in result.stdout.splitlines() if "=" in line)
+    return properties.get("Active", "yes") == "yes" and properties.get("LockedHint") != "yes"
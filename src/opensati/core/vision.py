@@ -6,15 +6,16 @@ import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from io import BytesIO
+from typing import Any
 
 import cv2
 import mss
 import numpy as np
-from PIL import Image
 
+from opensati.config.settings import get_settings
 
-@dataclass
+
+@dataclass(slots=True)
 class ScreenState:
     """Current screen analysis state."""
 
@@ -22,7 +23,7 @@ class ScreenState:
     has_screenshot: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PostureState:
     """Current posture analysis state."""
 
@@ -50,6 +51,8 @@ class ScreenCapture:
     # Internal state
     _sct: mss.mss | None = None
     _last_capture: np.ndarray | None = None
+    _buffer: np.ndarray | None = None  # Reused BGR frame buffer
+    _brightness: float = 0.0  # Mean luma of the last capture
     _lock: threading.Lock = field(default_factory=threading.Lock)
 
     def __post_init__(self) -> None:
@@ -61,7 +64,7 @@ class ScreenCapture:
         """
         Capture current screen.
 
-        Returns numpy array (RGB), or None on failure.
+        Returns numpy array (BGR, OpenCV channel order), or None on failure.
         Screenshot is stored ONLY in RAM.
         """
         try:
@@ -69,24 +72,31 @@ class ScreenCapture:
             monitor = self._sct.monitors[1]
             screenshot = self._sct.grab(monitor)
 
-            # Convert to numpy array
-            img = np.array(screenshot)
+            # View the BGRA pixels in place (no copy)
+            img = np.asarray(screenshot)
 
-            # Convert BGRA to RGB
-            img = cv2.cvtColor(img, cv2.COLOR_BGRA2RGB)
-
-            # Downscale for efficiency
+            # Downscale for efficiency (before color conversion, so fewer
+            # pixels are converted). Area averaging keeps small text legible
+            # for the VLM instead of aliasing it away.
             if self.scale_factor < 1.0:
                 new_size = (
                     int(img.shape[1] * self.scale_factor),
                     int(img.shape[0] * self.scale_factor),
                 )
-                img = cv2.resize(img, new_size)
+                img = cv2.resize(img, new_size, interpolation=cv2.INTER_AREA)
 
             with self._lock:
-                self._last_capture = img
+                # Drop alpha into the reused frame buffer
+                shape = (*img.shape[:2], 3)
+                if self._buffer is None or self._buffer.shape != shape:
+                    self._buffer = np.empty(shape, dtype=np.uint8)
+                cv2.cvtColor(img, cv2.COLOR_BGRA2BGR, dst=self._buffer)
+                self._last_capture = self._buffer
+                self._brightness = float(
+                    cv2.cvtColor(self._buffer, cv2.COLOR_BGR2GRAY).mean()
+                )
 
-            return img
+            return self._buffer
 
         except Exception as e:
             print(f"⚠️ Screen capture failed: {e}")
@@ -102,13 +112,30 @@ class ScreenCapture:
             if self._last_capture is None:
                 return None
 
-            img = self._last_capture.copy()
+            # Encode straight from the frame buffer (already BGR, as
+            # OpenCV expects) while holding the lock, since the next
+            # capture overwrites it in place
+            ok, encoded = cv2.imencode(
+                ".jpg", self._last_capture, [cv2.IMWRITE_JPEG_QUALITY, 60]
+            )
+
+        return encoded.tobytes() if ok else None
+
+    def get_dhash(self) -> int | None:
+        """
+        Get a 64-bit difference hash of the last capture.
+
+        Visually similar frames produce hashes with a small Hamming distance.
+        """
+        with self._lock:
+            if self._last_capture is None:
+                return None
+
+            small = cv2.resize(self._last_capture, (9, 8), interpolation=cv2.INTER_AREA)
 
-        # Convert to PIL and then to JPEG bytes
-        pil_img = Image.fromarray(img)
-        buffer = BytesIO()
-        pil_img.save(buffer, format="JPEG", quality=60)
-        return buffer.getvalue()
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        bits = gray[:, 1:] > gray[:, :-1]
+        return int.from_bytes(np.packbits(bits).tobytes(), "big")
 
     def get_state(self) -> ScreenState:
         """Get current screen state."""
@@ -116,16 +143,15 @@ class ScreenCapture:
             if self._last_capture is None:
                 return ScreenState()
 
-            # Calculate average brightness
-            gray = cv2.cvtColor(self._last_capture, cv2.COLOR_RGB2GRAY)
-            brightness = float(np.mean(gray))
-
-        return ScreenState(brightness=brightness, has_screenshot=True)
+            return ScreenState(brightness=self._brightness, has_screenshot=True)
 
     def clear(self) -> None:
         """Clear cached screenshot from memory."""
         with self._lock:
             self._last_capture = None
+            self._brightness = 0.0
+            if self._buffer is not None:
+                self._buffer.fill(0)  # Buffer is reused, so wipe its pixels
 
 
 @dataclass
@@ -143,6 +169,7 @@ class PostureDetector:
     neck_angle_threshold: int = 15  # Degrees forward = "tech neck"
     check_interval: float = 10.0  # Seconds between checks
     camera_index: int = 0
+    face_model: str = ""  # YuNet ONNX model path; empty = Haar cascade
 
     # Callbacks
     on_bad_posture: Callable[[float], None] | None = None
@@ -152,9 +179,18 @@ class PostureDetector:
     _running: bool = False
     _capture: cv2.VideoCapture | None = None
     _face_cascade: cv2.CascadeClassifier | None = None
+    _face_net: cv2.FaceDetectorYN | None = None
+    _frame: np.ndarray | None = None  # Reused BGR frame buffer
+    _gray: np.ndarray | None = None  # Reused grayscale buffer
     _last_check: float = 0.0
     _last_angle: float = 0.0
     _was_bad_posture: bool = False
+    _cached_state: PostureState | None = None  # Result of the last real check
+
+    def __post_init__(self) -> None:
+        """Use the configured face model if none was given."""
+        if not self.face_model:
+            self.face_model = get_settings().posture.face_model
 
     def start(self) -> bool:
         """
@@ -168,9 +204,24 @@ class PostureDetector:
                 print("⚠️ Could not open webcam")
                 return False
 
-            # Load face detection model
-            cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-            self._face_cascade = cv2.CascadeClassifier(cascade_path)
+            # Low resolution is plenty for locating a face, and Haar
+            # detection cost scales with pixel count
+            self._capture.set(cv2.CAP_PROP_FRAME_WIDTH, 320)
+            self._capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 240)
+
+            # Load face detection model: the YuNet CNN when a model file is
+            # configured (better at oblique angles, gives landmarks),
+            # otherwise the bundled Haar cascade
+            if self.face_model:
+                try:
+                    self._face_net = cv2.FaceDetectorYN.create(
+                        self.face_model, "", (320, 240), score_threshold=0.6
+                    )
+                except Exception as e:
+                    print(f"⚠️ Could not load face model, using Haar cascade: {e}")
+            if self._face_net is None:
+                cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+                self._face_cascade = cv2.CascadeClassifier(cascade_path)
 
             self._running = True
             print("📷 Posture detector started (posture only - no images stored)")
@@ -183,11 +234,16 @@ class PostureDetector:
     def stop(self) -> None:
         """Stop posture monitoring."""
         self._running = False
+        self._cached_state = None
 
         if self._capture:
             self._capture.release()
             self._capture = None
 
+        # Drop the reused buffers so no webcam frame outlives monitoring
+        self._frame = None
+        self._gray = None
+
         print("📷 Posture detector stopped")
 
     def _detect_posture(self) -> tuple[float, bool]:
@@ -197,31 +253,26 @@ class PostureDetector:
         Returns (neck_angle, face_detected).
         A positive angle means leaning forward (bad posture).
         """
-        if not self._capture or not self._face_cascade:
+        face_net, face_cascade = self._face_net, self._face_cascade
+        if not self._capture or not (face_net or face_cascade):
             return (0.0, False)
 
-        ret, frame = self._capture.read()
+        ret, frame = self._capture.read(self._frame)
         if not ret:
             return (0.0, False)
+        self._frame = frame
 
-        # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
-        # Detect faces
-        faces = self._face_cascade.detectMultiScale(
-            gray, scaleFactor=1.1, minNeighbors=5, minSize=(100, 100)
-        )
+        if face_net is not None:
+            face_center_y = self._locate_face_landmarks(face_net, frame)
+        else:
+            face_center_y = self._locate_face_cascade(face_cascade, frame)
 
-        if len(faces) == 0:
+        if face_center_y is None:
             return (0.0, False)
 
-        # Use largest face
-        x, y, w, h = max(faces, key=lambda f: f[2] * f[3])
-
         # Estimate neck angle from face position
         # If face is in lower third of frame = leaning forward
         frame_height = frame.shape[0]
-        face_center_y = y + h / 2
 
         # Normalize to -1 to 1 (0 = center, positive = lower/forward)
         position_ratio = (face_center_y - frame_height / 2) / (frame_height / 2)
@@ -231,19 +282,49 @@ class PostureDetector:
 
         return (neck_angle, True)
 
+    def _locate_face_landmarks(
+        self, face_net: cv2.FaceDetectorYN, frame: np.ndarray
+    ) -> float | None:
+        """Return the nose-tip y of the largest YuNet face, or None."""
+        face_net.setInputSize((frame.shape[1], frame.shape[0]))
+        _, faces = face_net.detect(frame)
+        if faces is None or len(faces) == 0:
+            return None
+
+        # Rows are [x, y, w, h, right eye, left eye, nose, mouth corners, score]
+        face = max(faces, key=lambda f: f[2] * f[3])
+        return float(face[9])
+
+    def _locate_face_cascade(
+        self, face_cascade: Any, frame: np.ndarray  # cv2.CascadeClassifier
+    ) -> float | None:
+        """Return the box-centre y of the largest Haar face, or None."""
+        # Convert to grayscale into the reused buffer
+        if self._gray is None or self._gray.shape != frame.shape[:2]:
+            self._gray = np.empty(frame.shape[:2], dtype=np.uint8)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        # Detect faces at least a fifth of the frame tall, whatever
+        # resolution the camera actually delivers
+        min_face = frame.shape[0] // 5
+        faces = face_cascade.detectMultiScale(
+            gray, scaleFactor=1.1, minNeighbors=5, minSize=(min_face, min_face)
+        )
+        if len(faces) == 0:
+            return None
+
+        # Use largest face
+        x, y, w, h = max(faces, key=lambda f: f[2] * f[3])
+        return float(y + h / 2)
+
     def check_posture(self) -> PostureState:
         """Check current posture."""
         if not self._running:
             return PostureState(is_enabled=False)
 
-        now = time.time()
-        if now - self._last_check < self.check_interval:
-            return PostureState(
-                neck_angle=self._last_angle,
-                is_good_posture=self._last_angle < self.neck_angle_threshold,
-                face_detected=True,
-                is_enabled=True,
-            )
+        now = time.monotonic()
+        if self._cached_state and now - self._last_check < self.check_interval:
+            return self._cached_state
 
         self._last_check = now
         angle, detected = self._detect_posture()
@@ -261,12 +342,13 @@ class PostureDetector:
 
         self._was_bad_posture = is_bad
 
-        return PostureState(
+        self._cached_state = PostureState(
             neck_angle=angle,
             is_good_posture=not is_bad,
             face_detected=detected,
             is_enabled=True,
         )
+        return self._cached_state
 
     def get_state(self) -> PostureState:
         """Get current posture state."""
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-import threading
-import time
 from dataclasses import dataclass
+from typing import Any
 
 import customtkinter as ctk
 
+from opensati.core.session import is_display_active
+from opensati.ui.overlay_window import call_on_tk, create_overlay_window, fade_in
 
-@dataclass
+
+@dataclass(slots=True)
 class BlurOverlay:
     """
     Blurs the screen when bad posture is detected.
@@ -21,32 +23,31 @@ class BlurOverlay:
     blur_intensity: float = 0.7  # 0-1
     fade_duration: float = 1.0
 
+    # Tk widget used to reach the Tk thread from other threads (the app's root)
+    tk_root: Any = None
+
     # Internal state
     _active: bool = False
     _window: ctk.CTk | None = None
-    _current_alpha: float = 0.0
 
     def show(self) -> None:
         """Show blur overlay."""
         if self._active:
             return
 
+        if not is_display_active():
+            return  # Screen locked; nobody would see it
+
         self._active = True
 
         def create_window():
-            self._window = ctk.CTkToplevel()
-            self._window.title("")
-            self._window.attributes("-topmost", True)
-            self._window.overrideredirect(True)
-
-            # Full screen
-            screen_width = self._window.winfo_screenwidth()
-            screen_height = self._window.winfo_screenheight()
-            self._window.geometry(f"{screen_width}x{screen_height}+0+0")
+            # Hidden before the Tk loop got here, or an earlier queued
+            # create() already built the window
+            if not self._active or self._window is not None:
+                return
 
-            # Semi-transparent dark overlay
-            self._window.configure(fg_color="#000000")
-            self._window.attributes("-alpha", 0.0)
+            # Full-screen dark overlay, starting transparent
+            self._window = create_overlay_window("#000000")
 
             # Add message
             label = ctk.CTkLabel(
@@ -60,12 +61,11 @@ class BlurOverlay:
             # Fade in
             self._fade_in()
 
-        # Run on main thread if needed
-        if threading.current_thread() is threading.main_thread():
-            create_window()
-        else:
-            # Schedule for later (would need main app reference)
-            pass
+        # Widgets must be built on the Tk thread
+        if not call_on_tk(self.tk_root, create_window):
+            self._active = False
+            print("⚠️ Blur overlay needs a Tk root when shown from another thread")
+            return
 
         print("🌫️ Blur overlay shown - fix posture to clear")
 
@@ -74,26 +74,18 @@ class BlurOverlay:
         if not self._window:
             return
 
-        steps = 20
-        step_duration = self.fade_duration / steps
-        target_alpha = self.blur_intensity
-
-        def fade():
-            for i in range(steps):
-                if not self._active:
-                    break
-                alpha = (i + 1) / steps * target_alpha
-                self._current_alpha = alpha
-                if self._window:
-                    self._window.attributes("-alpha", alpha)
-                time.sleep(step_duration)
-
-        threading.Thread(target=fade, daemon=True).start()
+        window = self._window
+        fade_in(
+            window,
+            self.blur_intensity,
+            self.fade_duration,
+            max(1, int(1000 * self.fade_duration / 20)),  # ~20 steps
+            lambda: self._active and window is self._window,
+        )
 
     def hide(self) -> None:
         """Hide blur overlay immediately."""
         self._active = False
-        self._current_alpha = 0.0
 
         if self._window:
             self._window.destroy()
@@ -2,15 +2,60 @@
 
 from __future__ import annotations
 
+import os
+import re
+import sys
 import threading
-import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from typing import Any
 
 import customtkinter as ctk
 import psutil
 
 from opensati.config.settings import get_settings
+from opensati.core.session import is_display_active
+from opensati.ui.overlay_window import call_on_tk, create_overlay_window
+
+_IS_LINUX = sys.platform.startswith("linux")
+
+# Seconds between meeting checks. Poll slowly until a meeting app shows up,
+# then quickly so the end of the meeting is caught promptly.
+_IDLE_POLL = 30.0
+_MEETING_POLL = 2.0
+
+# Breathing-circle radii (px) over the 8-second pulse cycle
+_PULSE_RADII: tuple[int, ...] = tuple(
+    int(36 * (1.0 + 0.1 * abs((k % 8) - 4) / 4)) for k in range(8)
+)
+_CIRCLE_CANVAS = 160  # Canvas side, leaves room for the largest radius
+
+# Linux truncates /proc/<pid>/comm to this many characters
+_COMM_LEN = 15
+
+
+def _read_process_name(pid: int) -> str:
+    """Return a process name, or "" if it is gone or not readable."""
+    if _IS_LINUX:
+        # Small /proc reads instead of building a psutil.Process
+        try:
+            with open(f"/proc/{pid}/comm") as f:
+                name = f.read().rstrip("\n")
+            if len(name) < _COMM_LEN:
+                return name
+            # Possibly truncated; recover the full name from argv[0]
+            # like psutil does
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                argv0 = f.read().split(b"\0", 1)[0].decode(errors="replace")
+        except OSError:
+            return ""
+        exe = os.path.basename(argv0)
+        return exe if exe.startswith(name) else name
+
+    try:
+        return psutil.Process(pid).name()
+    except psutil.Error:
+        return ""
 
 
 @dataclass
@@ -29,6 +74,9 @@ class DecompressionScreen:
     on_complete: Callable[[], None] | None = None
     on_skip: Callable[[], None] | None = None
 
+    # Tk widget used to reach the Tk thread from other threads (the app's root)
+    tk_root: Any = None
+
     # Internal state
     _window: ctk.CTkToplevel | None = None
     _active: bool = False
@@ -36,6 +84,12 @@ class DecompressionScreen:
     _was_in_meeting: bool = False
     _monitor_thread: threading.Thread | None = None
     _running: bool = False
+    _stop_event: threading.Event | None = None  # Owned by the current monitor
+    _timer_label: ctk.CTkLabel | None = None
+    _canvas: ctk.CTkCanvas | None = None
+    _oval_id: int = 0  # Breathing circle item, moved in place as it pulses
+    _meeting_pattern: re.Pattern[str] | None = None  # Any meeting app name, caseless
+    _pid_is_meeting: dict[int, bool] = field(default_factory=dict)  # Kept between polls
 
     def __post_init__(self) -> None:
         """Initialize with settings."""
@@ -43,13 +97,30 @@ class DecompressionScreen:
         if not self.meeting_apps:
             self.meeting_apps = settings.meeting.apps
         self.duration = settings.meeting.decompression_duration
+        if self.meeting_apps:
+            # One alternation scans a name once instead of once per app
+            self._meeting_pattern = re.compile(
+                "|".join(re.escape(app) for app in self.meeting_apps), re.IGNORECASE
+            )
 
     def start_monitoring(self) -> None:
         """Start monitoring for meeting app closures."""
+        if self._running:
+            return
+
+        # Each monitor gets its own stop event, so one that hasn't woken up
+        # since stop_monitoring() can't be revived by a restart
         self._running = True
+        self._stop_event = threading.Event()
+
+        def monitor(stop_event: threading.Event) -> None:
+            while not stop_event.is_set():
+                if not is_display_active():
+                    # Nothing to show while locked; check again later
+                    if stop_event.wait(_IDLE_POLL):
+                        break
+                    continue
 
-        def monitor():
-            while self._running:
                 in_meeting = self._check_meeting_active()
 
                 # Detect transition from meeting to no-meeting
@@ -57,51 +128,60 @@ class DecompressionScreen:
                     self.show()
 
                 self._was_in_meeting = in_meeting
-                time.sleep(5)  # Check every 5 seconds
+                interval = _MEETING_POLL if in_meeting else _IDLE_POLL
+                if stop_event.wait(interval):
+                    break
 
-        self._monitor_thread = threading.Thread(target=monitor, daemon=True)
+        self._monitor_thread = threading.Thread(
+            target=monitor, args=(self._stop_event,), daemon=True
+        )
         self._monitor_thread.start()
         print("🎥 Meeting monitor started")
 
     def stop_monitoring(self) -> None:
         """Stop monitoring for meetings."""
         self._running = False
+        if self._stop_event is not None:
+            self._stop_event.set()  # Wake the monitor so it exits now
+            self._stop_event = None
+        self._monitor_thread = None
         print("🎥 Meeting monitor stopped")
 
     def _check_meeting_active(self) -> bool:
-        """Check if any meeting app is running."""
-        for proc in psutil.process_iter(["name"]):
-            try:
-                name = proc.info["name"]
-                if name and any(
-                    app.lower() in name.lower() for app in self.meeting_apps
-                ):
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-        return False
+        """
+        Check if any meeting app is running.
+
+        Whether a process is a meeting app is decided once, when its PID
+        first shows up; later polls only look at PIDs that are new.
+        """
+        pids = set(psutil.pids())
+        cache = self._pid_is_meeting
+        for pid in cache.keys() - pids:
+            del cache[pid]
+        for pid in pids - cache.keys():
+            pattern = self._meeting_pattern
+            cache[pid] = pattern is not None and pattern.search(_read_process_name(pid)) is not None
+        return any(cache.values())
 
     def show(self) -> None:
         """Show decompression screen."""
         if self._active:
             return
 
+        if not is_display_active():
+            return  # Screen locked; nobody would see it
+
         self._active = True
         self._remaining = self.duration
 
         def create():
-            self._window = ctk.CTkToplevel()
-            self._window.title("")
-            self._window.attributes("-topmost", True)
-            self._window.overrideredirect(True)
-
-            # Full screen
-            screen_width = self._window.winfo_screenwidth()
-            screen_height = self._window.winfo_screenheight()
-            self._window.geometry(f"{screen_width}x{screen_height}+0+0")
+            # Hidden before the Tk loop got here, or an earlier queued
+            # create() already built the window
+            if not self._active or self._window is not None:
+                return
 
-            # Dark, calm background
-            self._window.configure(fg_color="#0A0A0B")
+            # Full screen, dark and calm background
+            self._window = create_overlay_window("#0A0A0B", alpha=None)
 
             # Center container
             container = ctk.CTkFrame(
@@ -110,13 +190,15 @@ class DecompressionScreen:
             container.place(relx=0.5, rely=0.5, anchor="center")
 
             # Breathing animation circle
-            self._circle = ctk.CTkLabel(
+            self._canvas = ctk.CTkCanvas(
                 container,
-                text="○",
-                font=("Helvetica", 72),
-                text_color="#4ADE80",
+                width=_CIRCLE_CANVAS,
+                height=_CIRCLE_CANVAS,
+                bg="#0A0A0B",
+                highlightthickness=0,
             )
-            self._circle.pack(pady=20)
+            self._oval_id = self._canvas.create_oval(0, 0, 0, 0, outline="#4ADE80", width=3)
+            self._canvas.pack(pady=20)
 
             # Message
             msg = ctk.CTkLabel(
@@ -153,8 +235,11 @@ class DecompressionScreen:
             # Start countdown
             self._countdown()
 
-        if threading.current_thread() is threading.main_thread():
-            create()
+        # show() is called from the monitor thread; widgets belong on the Tk thread
+        if not call_on_tk(self.tk_root, create):
+            self._active = False
+            print("⚠️ Decompression screen needs a Tk root to show from the monitor")
+            return
 
         print("🧘 Decompression started - breathe...")
 
@@ -170,14 +255,21 @@ class DecompressionScreen:
             return
 
         # Update timer display
-        if hasattr(self, "_timer_label") and self._timer_label:
+        if self._timer_label is not None:
             self._timer_label.configure(text=f"{self._remaining}s")
 
-        # Pulse the circle
-        if hasattr(self, "_circle"):
-            scale = 1.0 + 0.1 * abs((self._remaining % 8) - 4) / 4
-            size = int(72 * scale)
-            self._circle.configure(font=("Helvetica", size))
+        # Pulse the circle by moving its outline; the canvas keeps its size,
+        # so nothing is re-laid out
+        if self._canvas is not None:
+            center = _CIRCLE_CANVAS // 2
+            radius = _PULSE_RADII[self._remaining % 8]
+            self._canvas.coords(
+                self._oval_id,
+                center - radius,
+                center - radius,
+                center + radius,
+                center + radius,
+            )
 
         self._remaining -= 1
 
@@ -195,6 +287,8 @@ class DecompressionScreen:
     def hide(self) -> None:
         """Hide decompression screen."""
         self._active = False
+        self._timer_label = None
+        self._canvas = None
         if self._window:
             self._window.destroy()
             self._window = None
@@ -2,10 +2,58 @@
 
 from __future__ import annotations
 
+import ctypes
+import functools
 import platform
-import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from opensati.core.session import is_display_active
+
+# Display calls (xrandr, SetDeviceGammaRamp) can block, so they run on one
+# shared worker in submission order while the fade is timed on the Tk loop
+_GAMMA_WORKER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="opensati-gamma")
+
+# Windows gamma ramps (256 entries each for R, G, B), keyed by level in
+# thousandths; a fade revisits the same 50 levels every time
+_RAMP_CACHE: dict[int, ctypes.Array] = {}
+
+
+def _gamma_ramp(level: float) -> ctypes.Array:
+    """Build (or reuse) the Windows gamma ramp for a saturation level."""
+    key = round(level * 1000)
+    ramp = _RAMP_CACHE.get(key)
+    if ramp is None:
+        # Reduce color saturation by blending toward gray
+        scaled = np.arange(256, dtype=np.float64) * 256
+        gray = scaled * level + scaled * 0.3 * (1 - level)
+        channel = np.minimum(65535, gray).astype(np.uint16)
+        ramp = (ctypes.c_ushort * 256 * 3).from_buffer_copy(np.tile(channel, 3).tobytes())
+        _RAMP_CACHE[key] = ramp
+    return ramp
+
+
+# Private framework behind the Accessibility > Display "Grayscale" toggle
+_UNIVERSAL_ACCESS = (
+    "/System/Library/PrivateFrameworks/UniversalAccess.framework/UniversalAccess"
+)
+
+
+@functools.cache
+def _macos_grayscale_setter() -> Callable[[int], None] | None:
+    """Load UAGrayscaleSetEnabled once; None if it is not available."""
+    try:
+        setter = ctypes.CDLL(_UNIVERSAL_ACCESS).UAGrayscaleSetEnabled
+    except (OSError, AttributeError):
+        return None
+    setter.argtypes = [ctypes.c_int]
+    setter.restype = None
+    return setter
 
 
 @dataclass
@@ -20,11 +68,15 @@ class GrayscaleEffect:
     fade_duration: float = 5.0  # Seconds to fade to grayscale
     hold_duration: float = 120.0  # Seconds to hold before auto-restore
 
+    # Tk widget whose after() drives the fade (the app's root window)
+    tk_root: Any = None
+
     # Internal state
     _active: bool = False
     _saturation: float = 1.0  # 1.0 = full color, 0.0 = grayscale
-    _fade_thread: threading.Thread | None = None
-    _restore_timer: threading.Timer | None = None
+    _after_id: str | None = None  # Pending fade step or auto-restore
+    _displays: list[str] | None = None  # xrandr outputs for the current fade
+    _macos_gray: bool = False  # Whether the macOS grayscale filter is on
 
     def _apply_saturation(self, level: float) -> bool:
         """
@@ -46,26 +98,27 @@ class GrayscaleEffect:
             return False
 
     def _apply_macos(self, level: float) -> bool:
-        """Apply saturation on macOS using ColorSync."""
-
-        # Use AppleScript to toggle grayscale
-        # macOS doesn't have fine-grained saturation control via API
-        # So we use the Accessibility grayscale toggle
-        if level < 0.5:
-            # Enable grayscale
-            # Note: Full grayscale on macOS requires Accessibility permissions
-            # For now, we'll use the gamma approach as fallback
-            pass
-
-        # Fallback: Adjust gamma to simulate grayscale
-        # This doesn't actually make it grayscale but dims effectiveness
+        """Apply saturation on macOS using the Accessibility grayscale filter."""
+
+        # macOS doesn't have fine-grained saturation control via API,
+        # so the filter is switched on halfway through the fade
+        gray = level < 0.5
+        if gray == self._macos_gray:
+            return True
+
+        # Called in-process, no osascript round trip
+        setter = _macos_grayscale_setter()
+        if setter is None:
+            # Framework missing on this macOS version; nothing to toggle
+            return True
+
+        setter(int(gray))
+        self._macos_gray = gray
         return True
 
     def _apply_windows(self, level: float) -> bool:
         """Apply saturation on Windows using MagSetFullscreenColorEffect."""
         try:
-            import ctypes
-
             # Use Windows Magnification API for color effects
             # Requires magnification.dll
 
@@ -75,17 +128,7 @@ class GrayscaleEffect:
 
             hdc = user32.GetDC(0)
 
-            # Create grayscale gamma ramp
-            ramp = (ctypes.c_ushort * 256 * 3)()
-
-            for i in range(256):
-                # Reduce color saturation by blending toward gray
-                gray = int(i * 256 * level + (i * 256 * 0.3) * (1 - level))
-                gray = min(65535, gray)
-                ramp[0][i] = gray  # Red
-                ramp[1][i] = gray  # Green
-                ramp[2][i] = gray  # Blue
-
+            ramp = _gamma_ramp(level)
             gdi32.SetDeviceGammaRamp(hdc, ctypes.byref(ramp))
             user32.ReleaseDC(0, hdc)
 
@@ -95,33 +138,35 @@ class GrayscaleEffect:
             print(f"⚠️ Windows gamma failed: {e}")
             return False
 
+    def _discover_displays(self) -> list[str]:
+        """List connected xrandr outputs."""
+        import subprocess
+
+        result = subprocess.run(
+            ["xrandr", "--current"],
+            capture_output=True,
+            text=True,
+        )
+        return [line.split()[0] for line in result.stdout.split("\n") if " connected" in line]
+
     def _apply_linux(self, level: float) -> bool:
         """Apply saturation on Linux using xrandr or similar."""
         import subprocess
 
         try:
-            # Get current display
-            result = subprocess.run(
-                ["xrandr", "--current"],
-                capture_output=True,
-                text=True,
-            )
-
-            # Parse connected displays
-            displays = []
-            for line in result.stdout.split("\n"):
-                if " connected" in line:
-                    displays.append(line.split()[0])
-
-            # Apply gamma to each display
-            for display in displays:
-                # Approximate grayscale with gamma
-                # Full grayscale would require a shader/compositor
-                gamma = f"{level}:{level}:{level}"
-                subprocess.run(
-                    ["xrandr", "--output", display, "--gamma", gamma],
-                    check=True,
-                )
+            # Displays are looked up once per fade, not per step
+            if self._displays is None:
+                self._displays = self._discover_displays()
+            if not self._displays:
+                return True
+
+            # Approximate grayscale with gamma, all displays in one call
+            # Full grayscale would require a shader/compositor
+            gamma = f"{level}:{level}:{level}"
+            command = ["xrandr"]
+            for display in self._displays:
+                command += ["--output", display, "--gamma", gamma]
+            subprocess.run(command, check=True)
 
             return True
 
@@ -130,48 +175,59 @@ class GrayscaleEffect:
             return False
 
     def start_fade(self) -> None:
-        """Start fading to grayscale."""
+        """Start fading to grayscale (call on the Tk thread)."""
         if self._active:
             return
 
+        if not is_display_active():
+            return  # Screen locked; nobody would see it
+
+        if self.tk_root is None:
+            print("⚠️ Grayscale fade needs a Tk root to run on")
+            return
+
         self._active = True
         self._saturation = 1.0
+        self._displays = None  # Rediscover outputs, monitors may have changed
 
-        def fade():
-            steps = 50
-            step_duration = self.fade_duration / steps
-            step_size = 1.0 / steps
+        self._fade_step(0, 50, time.monotonic())
 
-            for i in range(steps):
-                if not self._active:
-                    break
+        print("🌑 Grayscale fade started")
 
-                self._saturation = 1.0 - (step_size * (i + 1))
-                self._apply_saturation(self._saturation)
-                time.sleep(step_duration)
+    def _fade_step(self, step: int, steps: int, started: float) -> None:
+        """Apply one fade step on the Tk loop, then schedule the next."""
+        self._after_id = None
+        if not self._active:
+            return
 
-            # Set up auto-restore timer
-            if self._active:
-                self._restore_timer = threading.Timer(
-                    self.hold_duration, self.restore
-                )
-                self._restore_timer.start()
+        if step >= steps:
+            # Faded out; restore automatically after the hold
+            self._schedule(started + self.fade_duration + self.hold_duration, self.restore)
+            return
 
-        self._fade_thread = threading.Thread(target=fade, daemon=True)
-        self._fade_thread.start()
+        self._saturation = 1.0 - (step + 1) / steps
+        _GAMMA_WORKER.submit(self._apply_saturation, self._saturation)
 
-        print("🌑 Grayscale fade started")
+        # Steps are timed from the fade start, so slow steps don't add up
+        deadline = started + (step + 1) * self.fade_duration / steps
+        self._schedule(deadline, self._fade_step, step + 1, steps, started)
+
+    def _schedule(self, deadline: float, callback: Callable[..., None], *args: Any) -> None:
+        """Run callback on the Tk loop at a time.monotonic() deadline."""
+        delay_ms = int(max(0.0, deadline - time.monotonic()) * 1000)
+        self._after_id = self.tk_root.after(delay_ms, callback, *args)
 
     def restore(self) -> None:
         """Restore full color immediately."""
         self._active = False
         self._saturation = 1.0
 
-        if self._restore_timer:
-            self._restore_timer.cancel()
-            self._restore_timer = None
+        # Cancel a pending fade step or auto-restore
+        if self._after_id and self.tk_root is not None:
+            self.tk_root.after_cancel(self._after_id)
+        self._after_id = None
 
-        self._apply_saturation(1.0)
+        _GAMMA_WORKER.submit(self._apply_saturation, 1.0)  # Queued after any pending step
         print("🌈 Color restored")
 
     def is_active(self) -> bool:
@@ -2,15 +2,35 @@
 
 from __future__ import annotations
 
-import threading
-import time
 from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 import customtkinter as ctk
 
+from opensati.core.session import is_display_active
+from opensati.ui.overlay_window import call_on_tk, create_overlay_window, fade_in
 
-@dataclass
+# Length of the fade-in, and delay between its frames. Four eased frames
+# look as smooth as ten linear ones at less than half the alpha writes.
+_FADE_SECONDS = 0.2
+_FADE_FRAME_MS = 50
+
+
+def _ease_out(progress: float) -> float:
+    """Ease out: fast start, gentle finish."""
+    return 1.0 - (1.0 - progress) ** 2
+
+
+def _toast_geometry(screen_width: int, screen_height: int) -> str:
+    """420x100 window centered near the bottom of the screen."""
+    width, height = 420, 100
+    x = (screen_width - width) // 2
+    y = screen_height - height - 50
+    return f"{width}x{height}+{x}+{y}"
+
+
+@dataclass(slots=True)
 class NotificationOverlay:
     """
     Floating notification pill for interventions.
@@ -22,6 +42,9 @@ class NotificationOverlay:
     on_accept: Callable[[], None] | None = None
     on_dismiss: Callable[[], None] | None = None
 
+    # Tk widget used to reach the Tk thread from other threads (the app's root)
+    tk_root: Any = None
+
     # Internal state
     _window: ctk.CTkToplevel | None = None
     _visible: bool = False
@@ -37,27 +60,19 @@ class NotificationOverlay:
         if self._visible:
             return
 
+        if not is_display_active():
+            return  # Screen locked; nobody would see it
+
         self._visible = True
 
         def create():
-            # Create toplevel window
-            self._window = ctk.CTkToplevel()
-            self._window.title("")
-            self._window.attributes("-topmost", True)
-            self._window.overrideredirect(True)
-
-            # Size and position (bottom center)
-            width = 420
-            height = 100
-            screen_width = self._window.winfo_screenwidth()
-            screen_height = self._window.winfo_screenheight()
-            x = (screen_width - width) // 2
-            y = screen_height - height - 50
+            # Hidden before the Tk loop got here, or an earlier queued
+            # create() already built the window
+            if not self._visible or self._window is not None:
+                return
 
-            self._window.geometry(f"{width}x{height}+{x}+{y}")
-
-            # Styling (based on design system)
-            self._window.configure(fg_color="#1C1C1E")  # --bg-elevated
+            # Bottom-center toast, starting invisible (--bg-elevated)
+            self._window = create_overlay_window("#1C1C1E", _toast_geometry)
 
             # Main frame with border
             frame = ctk.CTkFrame(
@@ -124,31 +139,27 @@ class NotificationOverlay:
             )
             dismiss_btn.pack(side="left", padx=4)
 
-            # Start invisible, then fade in
-            self._window.attributes("-alpha", 0.0)
             self._fade_in()
 
-        # Must run on main thread
-        if threading.current_thread() is threading.main_thread():
-            create()
-        else:
-            # Would need reference to main app to schedule
-            pass
+        # Widgets must be built on the Tk thread
+        if not call_on_tk(self.tk_root, create):
+            self._visible = False
+            print("⚠️ Notification needs a Tk root when shown from another thread")
 
     def _fade_in(self) -> None:
         """Fade in animation."""
         if not self._window:
             return
 
-        def fade():
-            for i in range(10):
-                if not self._visible or not self._window:
-                    break
-                alpha = (i + 1) / 10 * 0.95
-                self._window.attributes("-alpha", alpha)
-                time.sleep(0.02)
-
-        threading.Thread(target=fade, daemon=True).start()
+        window = self._window
+        fade_in(
+            window,
+            0.95,
+            _FADE_SECONDS,
+            _FADE_FRAME_MS,
+            lambda: self._visible and window is self._window,
+            _ease_out,
+        )
 
     def _on_accept_click(self) -> None:
         """Handle accept button click."""
@@ -7,8 +7,22 @@ from dataclasses import dataclass
 
 import customtkinter as ctk
 
+from opensati.core.session import is_display_active
+from opensati.ui.overlay_window import create_overlay_window, fade_in
 
-@dataclass
+# Length of the fade-in, and delay between its frames (~30 fps)
+_FADE_SECONDS = 0.2
+_FADE_FRAME_MS = 33
+
+
+def _bar_geometry(screen_width: int, screen_height: int) -> str:
+    """500x60 bar centered near the top of the screen."""
+    width, height = 500, 60
+    x = (screen_width - width) // 2
+    return f"{width}x{height}+{x}+50"
+
+
+@dataclass(slots=True)
 class IntentBar:
     """
     Floating intent input bar.
@@ -31,23 +45,14 @@ class IntentBar:
             self._window.focus()
             return
 
+        if not is_display_active():
+            return  # Screen locked; nobody would see it
+
         self._current_intent = current_intent
 
         # Create window
-        self._window = ctk.CTkToplevel()
-        self._window.title("")
-        self._window.attributes("-topmost", True)
-        self._window.overrideredirect(True)
-
-        # Size and position (top center)
-        width = 500
-        height = 60
-        screen_width = self._window.winfo_screenwidth()
-        x = (screen_width - width) // 2
-        y = 50
-
-        self._window.geometry(f"{width}x{height}+{x}+{y}")
-        self._window.configure(fg_color="#1C1C1E")
+        # Top-center bar, starting invisible
+        self._window = create_overlay_window("#1C1C1E", _bar_geometry)
 
         # Main frame with border
         frame = ctk.CTkFrame(
@@ -118,7 +123,6 @@ class IntentBar:
         self._entry.focus()
 
         # Fade in
-        self._window.attributes("-alpha", 0.0)
         self._fade_in()
 
     def _fade_in(self) -> None:
@@ -126,18 +130,10 @@ class IntentBar:
         if not self._window:
             return
 
-        import threading
-        import time
-
-        def fade():
-            for i in range(10):
-                if not self._window:
-                    break
-                alpha = (i + 1) / 10 * 0.95
-                self._window.attributes("-alpha", alpha)
-                time.sleep(0.02)
-
-        threading.Thread(target=fade, daemon=True).start()
+        window = self._window
+        fade_in(
+            window, 0.95, _FADE_SECONDS, _FADE_FRAME_MS, lambda: window is self._window
+        )
 
     def _on_enter(self, event) -> None:
         """Handle enter key."""
@@ -0,0 +1,103 @@
+"""Shared setup for borderless, always-on-top overlay windows."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from tkinter import TclError
+from typing import Any
+
+import customtkinter as ctk
+
+
+def call_on_tk(tk_root: Any, fn: Callable[[], object]) -> bool:
+    """
+    Run fn on the Tk thread.
+
+    Runs it directly when already there, otherwise queues it with
+    tk_root.after(0, ...). Returns False if there is no root to queue on.
+    """
+    if threading.current_thread() is threading.main_thread():
+        fn()
+    elif tk_root is not None:
+        tk_root.after(0, fn)
+    else:
+        return False
+    return True
+
+
+def create_overlay_window(
+    fg_color: str,
+    geometry: Callable[[int, int], str] | None = None,
+    alpha: float | None = 0.0,
+) -> ctk.CTkToplevel:
+    """
+    Create a borderless window that stays above everything else.
+
+    ``geometry`` maps the screen size to a Tk geometry string; by default
+    the window covers the whole screen. The window starts at ``alpha``
+    (transparent, ready to fade in); pass None to leave it opaque.
+    """
+    window = ctk.CTkToplevel(fg_color=fg_color)
+    window.title("")
+    window.overrideredirect(True)
+
+    # One Tcl call for both window-manager attributes
+    if alpha is None:
+        window.attributes("-topmost", True)
+    else:
+        window.attributes("-topmost", True, "-alpha", alpha)
+
+    screen_width = window.winfo_screenwidth()
+    screen_height = window.winfo_screenheight()
+    if geometry is None:
+        window.geometry(f"{screen_width}x{screen_height}+0+0")
+    else:
+        window.geometry(geometry(screen_width, screen_height))
+
+    return window
+
+
+def fade_in(
+    window: ctk.CTkToplevel,
+    target_alpha: float,
+    seconds: float,
+    frame_ms: int,
+    still_current: Callable[[], bool],
+    easing: Callable[[float], float] | None = None,
+) -> None:
+    """
+    Fade a transparent window up to target_alpha on the Tk loop.
+
+    Alpha follows the time since the fade started rather than a step count,
+    so a late tick jumps ahead instead of painting stale frames. ``easing``
+    maps linear progress (0-1) to eased progress. The fade stops as soon as
+    still_current() is false, e.g. once the window was hidden or replaced.
+    """
+    started = time.monotonic()
+    last_alpha = 0.0
+
+    def step() -> None:
+        nonlocal last_alpha
+        if not still_current():
+            return
+
+        elapsed = time.monotonic() - started
+        progress = min(1.0, elapsed / seconds) if seconds > 0 else 1.0
+        eased = easing(progress) if easing else progress
+        alpha = round(eased * target_alpha, 3)
+
+        # Each attributes() call is a Tcl round-trip; skip invisible changes
+        if alpha != last_alpha:
+            last_alpha = alpha
+            try:
+                window.attributes("-alpha", alpha)
+                window.update_idletasks()  # Repaint without processing input events
+            except TclError:
+                return  # Window destroyed under us
+
+        if progress < 1.0:
+            window.after(frame_ms, step)
+
+    step()
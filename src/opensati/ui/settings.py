@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from tkinter import TclError
 
 import customtkinter as ctk
 
 from opensati.config.settings import Settings, get_settings
+from opensati.core.backends import backend_available
 
+# Delay between building deferred settings sections
+_SECTION_DELAY_MS = 10
 
-@dataclass
+# Delay before a slider's value label catches up with a drag (~30 fps)
+_LABEL_REFRESH_MS = 33
+
+
+@dataclass(slots=True)
 class SettingsWindow:
     """
     Settings window for OpenSati configuration.
@@ -25,26 +34,52 @@ class SettingsWindow:
     # Internal state
     _window: ctk.CTkToplevel | None = None
     _settings: Settings | None = None
+    _pending_sections: list[Callable[[ctk.CTkFrame], None]] = field(default_factory=list)
+    _build_after_id: str | None = None
+    _visible: bool = False  # Closing hides the window; it is built once
+
+    # Background saving: at most one writer, later saves coalesce into one
+    _save_lock: threading.Lock = field(default_factory=threading.Lock)
+    # Latest unwritten (settings, settings.to_dict()) pair
+    _pending_save: tuple[Settings, dict] | None = None
+    _save_running: bool = False
+
+    # Form variables, created with the window in show()
+    _keyboard_var: ctk.BooleanVar = field(init=False, repr=False)
+    _mouse_var: ctk.BooleanVar = field(init=False, repr=False)
+    _screen_var: ctk.BooleanVar = field(init=False, repr=False)
+    _webcam_var: ctk.BooleanVar = field(init=False, repr=False)
+    _mic_var: ctk.BooleanVar = field(init=False, repr=False)
+    _threshold_var: ctk.IntVar = field(init=False, repr=False)
+    _style_var: ctk.StringVar = field(init=False, repr=False)
+    _cooldown_var: ctk.IntVar = field(init=False, repr=False)
 
     def show(self) -> None:
         """Show settings window."""
-        if self._window is not None:
-            self._window.focus()
-            return
-
-        self._settings = get_settings()
-
+        window = self._window
+        if window is None:
+            window = self._build_window()
+        elif not self._visible:
+            # Reopened: discard edits that weren't saved last time
+            self._load_values()
+            window.deiconify()
+
+        self._visible = True
+        window.focus()
+
+    def _build_window(self) -> ctk.CTkToplevel:
+        """Create the window and its widgets (once per SettingsWindow)."""
         # Create window
-        self._window = ctk.CTkToplevel()
-        self._window.title("OpenSati Settings")
-        self._window.geometry("500x600")
-        self._window.resizable(False, False)
+        window = self._window = ctk.CTkToplevel()
+        window.title("OpenSati Settings")
+        window.geometry("500x600")
+        window.resizable(False, False)
 
         # Configure appearance
         ctk.set_appearance_mode("dark")
 
         # Main container with padding
-        container = ctk.CTkFrame(self._window, fg_color="#0A0A0B")
+        container = ctk.CTkFrame(window, fg_color="#0A0A0B")
         container.pack(fill="both", expand=True, padx=20, pady=20)
 
         # Title
@@ -64,62 +99,111 @@ class SettingsWindow:
         )
         scroll.pack(fill="both", expand=True)
 
-        # === Sensors Section ===
-        self._create_section(scroll, "🔒 Privacy & Sensors")
-
-        self._keyboard_var = ctk.BooleanVar(value=self._settings.sensors.keyboard)
-        self._create_toggle(
-            scroll, "Keyboard monitoring", self._keyboard_var, "Low risk - velocity only"
+        # Variables exist up front so saving works before every section is built
+        self._keyboard_var = ctk.BooleanVar()
+        self._mouse_var = ctk.BooleanVar()
+        self._screen_var = ctk.BooleanVar()
+        self._webcam_var = ctk.BooleanVar()
+        self._mic_var = ctk.BooleanVar()
+        self._threshold_var = ctk.IntVar()
+        self._style_var = ctk.StringVar()
+        self._cooldown_var = ctk.IntVar()
+        self._load_values()
+
+        # First section now; the rest one per event-loop tick so the window
+        # appears without waiting for every widget to draw
+        self._build_sensors_section(scroll)
+        self._pending_sections = [
+            self._build_detection_section,
+            self._build_intervention_section,
+            self._build_status_section,
+        ]
+        self._build_after_id = window.after(
+            _SECTION_DELAY_MS, self._build_next_section, scroll
         )
 
-        self._mouse_var = ctk.BooleanVar(value=self._settings.sensors.mouse)
-        self._create_toggle(
-            scroll, "Mouse monitoring", self._mouse_var, "Low risk - patterns only"
+        # Save button
+        save_btn = ctk.CTkButton(
+            container,
+            text="Save Settings",
+            height=40,
+            corner_radius=8,
+            fg_color="#4ADE80",
+            hover_color="#22C55E",
+            text_color="#000000",
+            font=("Inter", 14, "bold"),
+            command=self._save,
         )
+        save_btn.pack(fill="x", pady=(20, 0))
 
-        self._screen_var = ctk.BooleanVar(value=self._settings.sensors.screen)
-        self._create_toggle(
-            scroll, "Screen analysis", self._screen_var, "For intent checking (RAM only)"
-        )
+        # Handle close
+        window.protocol("WM_DELETE_WINDOW", self._close)
+        return window
 
-        self._webcam_var = ctk.BooleanVar(value=self._settings.sensors.webcam)
-        self._create_toggle(
-            scroll, "Webcam posture", self._webcam_var, "For posture detection (not stored)"
-        )
+    def _load_values(self) -> None:
+        """Set the form variables from the current settings."""
+        self._settings = get_settings()
+        self._keyboard_var.set(self._settings.sensors.keyboard)
+        self._mouse_var.set(self._settings.sensors.mouse)
+        self._screen_var.set(self._settings.sensors.screen)
+        self._webcam_var.set(self._settings.sensors.webcam)
+        self._mic_var.set(self._settings.sensors.microphone)
+        self._threshold_var.set(self._settings.detection.stress_threshold)
+        self._style_var.set(self._settings.intervention.style)
+        self._cooldown_var.set(self._settings.intervention.cooldown)
+
+    def _build_next_section(self, parent: ctk.CTkFrame) -> None:
+        """Build one deferred section, then schedule the next."""
+        self._build_after_id = None
+        if self._window is None or not self._pending_sections:
+            return
 
-        self._mic_var = ctk.BooleanVar(value=self._settings.sensors.microphone)
-        self._create_toggle(
-            scroll, "Microphone", self._mic_var, "For breathing analysis (not stored)"
+        self._pending_sections.pop(0)(parent)
+        if self._pending_sections:
+            self._build_after_id = self._window.after(
+                _SECTION_DELAY_MS, self._build_next_section, parent
+            )
+
+    def _build_sensors_section(self, parent: ctk.CTkFrame) -> None:
+        """Sensor toggles."""
+        self._create_section(parent, "🔒 Privacy & Sensors")
+        toggles = (
+            ("keyboard", "Keyboard monitoring", self._keyboard_var, "Low risk - velocity only"),
+            ("mouse", "Mouse monitoring", self._mouse_var, "Low risk - patterns only"),
+            ("screen", "Screen analysis", self._screen_var, "For intent checking (RAM only)"),
+            ("webcam", "Webcam posture", self._webcam_var, "For posture detection (not stored)"),
+            ("microphone", "Microphone", self._mic_var, "For breathing analysis (not stored)"),
         )
-
-        # === Detection Section ===
-        self._create_section(scroll, "🎯 Detection")
-
-        self._threshold_var = ctk.IntVar(value=self._settings.detection.stress_threshold)
+        for sensor, label, variable, description in toggles:
+            # No toggle for a sensor that can't run here; its setting is kept as is
+            if backend_available(sensor):
+                self._create_toggle(parent, label, variable, description)
+
+    def _build_detection_section(self, parent: ctk.CTkFrame) -> None:
+        """Detection thresholds."""
+        self._create_section(parent, "🎯 Detection")
         self._create_slider(
-            scroll, "Stress threshold", self._threshold_var, 20, 100, "Keystrokes/10s"
+            parent, "Stress threshold", self._threshold_var, 20, 100, "Keystrokes/10s"
         )
 
-        # === Intervention Section ===
-        self._create_section(scroll, "🌑 Intervention")
-
-        self._style_var = ctk.StringVar(value=self._settings.intervention.style)
+    def _build_intervention_section(self, parent: ctk.CTkFrame) -> None:
+        """Intervention style and cooldown."""
+        self._create_section(parent, "🌑 Intervention")
         self._create_dropdown(
-            scroll,
+            parent,
             "Intervention style",
             self._style_var,
             ["grayscale", "blur", "notification"],
         )
-
-        self._cooldown_var = ctk.IntVar(value=self._settings.intervention.cooldown)
         self._create_slider(
-            scroll, "Cooldown", self._cooldown_var, 30, 300, "seconds between"
+            parent, "Cooldown", self._cooldown_var, 30, 300, "seconds between"
         )
 
-        # === Privacy Status ===
-        self._create_section(scroll, "🔐 Privacy Status")
+    def _build_status_section(self, parent: ctk.CTkFrame) -> None:
+        """Read-only privacy status."""
+        self._create_section(parent, "🔐 Privacy Status")
 
-        status_frame = ctk.CTkFrame(scroll, fg_color="#141415", corner_radius=8)
+        status_frame = ctk.CTkFrame(parent, fg_color="#141415", corner_radius=8)
         status_frame.pack(fill="x", pady=5)
 
         status_text = """🔒 All data stays local
@@ -137,23 +221,6 @@ class SettingsWindow:
         )
         status_label.pack(padx=15, pady=15, anchor="w")
 
-        # Save button
-        save_btn = ctk.CTkButton(
-            container,
-            text="Save Settings",
-            height=40,
-            corner_radius=8,
-            fg_color="#4ADE80",
-            hover_color="#22C55E",
-            text_color="#000000",
-            font=("Inter", 14, "bold"),
-            command=self._save,
-        )
-        save_btn.pack(fill="x", pady=(20, 0))
-
-        # Handle close
-        self._window.protocol("WM_DELETE_WINDOW", self._close)
-
     def _create_section(self, parent: ctk.CTkFrame, title: str) -> None:
         """Create a section header."""
         label = ctk.CTkLabel(
@@ -237,9 +304,27 @@ class SettingsWindow:
         )
         value_label.pack(side="right")
 
+        pending: str | None = None  # after() id of a queued label update
+
+        def flush():
+            nonlocal pending
+            pending = None
+            try:
+                value_label.configure(text=f"{variable.get()} {unit}")
+            except TclError:
+                pass  # Window closed while the update was queued
+
+        def on_write(*_):
+            nonlocal pending
+            # Dragging fires once per pixel; redraw the label at most once a frame
+            if pending is None:
+                pending = value_label.after(_LABEL_REFRESH_MS, flush)
+
+        # Follow the variable, so values reloaded on reopen show up too
+        variable.trace_add("write", on_write)
+
         def on_change(val):
             variable.set(int(val))
-            value_label.configure(text=f"{int(val)} {unit}")
 
         slider = ctk.CTkSlider(
             slider_frame,
@@ -286,32 +371,78 @@ class SettingsWindow:
         """Save settings."""
         if self._settings:
             # Update settings from UI
-            self._settings.sensors.keyboard = self._keyboard_var.get()
-            self._settings.sensors.mouse = self._mouse_var.get()
-            self._settings.sensors.screen = self._screen_var.get()
-            self._settings.sensors.webcam = self._webcam_var.get()
-            self._settings.sensors.microphone = self._mic_var.get()
+            sensors = self._settings.sensors
+            sensors.keyboard = self._keyboard_var.get()
+            sensors.mouse = self._mouse_var.get()
+            sensors.screen = self._screen_var.get()
+            sensors.webcam = self._webcam_var.get()
+            sensors.microphone = self._mic_var.get()
+
             self._settings.detection.stress_threshold = self._threshold_var.get()
-            self._settings.intervention.style = self._style_var.get()
-            self._settings.intervention.cooldown = self._cooldown_var.get()
 
-            # Save to disk
-            self._settings.save()
+            intervention = self._settings.intervention
+            intervention.style = self._style_var.get()
+            intervention.cooldown = self._cooldown_var.get()
+
+            # Snapshot here, on the Tk thread; write it without blocking the UI
+            self._queue_save(self._settings, self._settings.to_dict())
 
             if self.on_save:
                 self.on_save(self._settings)
 
         self._close()
 
+    def _queue_save(self, settings: Settings, data: dict) -> None:
+        """Write a snapshot of settings to disk on a worker thread."""
+        with self._save_lock:
+            self._pending_save = (settings, data)
+            if self._save_running:
+                return  # The running writer picks this save up next
+            self._save_running = True
+
+        # Not a daemon, so a save in progress finishes before exit
+        threading.Thread(target=self._save_worker, name="opensati-settings-save").start()
+
+    def _save_worker(self) -> None:
+        """Write snapshots until no further save was requested meanwhile."""
+        running = True
+        try:
+            while running:
+                with self._save_lock:
+                    pending, self._pending_save = self._pending_save, None
+                    running = self._save_running = pending is not None
+
+                if pending is not None:
+                    settings, data = pending
+                    try:
+                        settings.write(data)
+                    except Exception as e:
+                        print(f"⚠️ Could not save settings: {e}")
+        finally:
+            if running:  # Interrupted mid-write; let the next save start a writer
+                with self._save_lock:
+                    self._save_running = False
+
     def _close(self) -> None:
-        """Close window."""
+        """Close window (hidden, so reopening skips rebuilding it)."""
         if self._window:
-            self._window.destroy()
-            self._window = None
+            self._window.withdraw()
+        self._visible = False
 
         if self.on_close:
             self.on_close()
 
+    def dispose(self) -> None:
+        """Destroy the window for good."""
+        self._pending_sections.clear()
+        if self._window:
+            if self._build_after_id:
+                self._window.after_cancel(self._build_after_id)
+                self._build_after_id = None
+            self._window.destroy()
+            self._window = None
+        self._visible = False
+
     def is_open(self) -> bool:
         """Check if window is open."""
-        return self._window is not None
+        return self._visible
@@ -4,7 +4,41 @@ from __future__ import annotations
 
 import threading
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
+
+# Imported once here rather than per icon. pystray stays lazy in start():
+# importing it picks a display backend, which can fail on headless systems.
+try:
+    from PIL import Image, ImageDraw
+
+    _pil_available = True
+except ImportError:
+    _pil_available = False
+
+_ICON_SIZE = 64
+_ICON_MARGIN = 8
+
+# Circle color per state; stress and flow are drawn filled, the rest as rings
+_STATE_COLORS = {
+    "active": "#4ADE80",  # Green
+    "paused": "#6E6E73",  # Gray
+    "stress": "#F97316",  # Orange
+    "flow": "#818CF8",  # Purple
+}
+
+
+def _render_icon(state: str) -> Any:
+    """Draw the tray icon for a state as a PIL image."""
+    image = Image.new("RGBA", (_ICON_SIZE, _ICON_SIZE), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    bounds = [_ICON_MARGIN, _ICON_MARGIN, _ICON_SIZE - _ICON_MARGIN, _ICON_SIZE - _ICON_MARGIN]
+    color = _STATE_COLORS[state]
+    if state in ("stress", "flow"):
+        draw.ellipse(bounds, fill=color)
+    else:
+        draw.ellipse(bounds, outline=color, width=4)
+    return image
 
 
 @dataclass
@@ -25,6 +59,8 @@ class TrayIcon:
     _icon = None
     _running: bool = False
     _paused: bool = False
+    _state: str = "active"
+    _state_images: dict[str, Any] = field(default_factory=dict)  # Rendered once in start()
 
     def start(self) -> bool:
         """
@@ -32,30 +68,25 @@ class TrayIcon:
 
         Returns True if successful.
         """
+        if not _pil_available:
+            print("⚠️ Pillow not installed. Tray icon disabled.")
+            return False
+
         try:
+            import platform
+
             import pystray
-            from PIL import Image, ImageDraw
 
-            # Create icon image
-            icon_size = 64
-            
             # macOS Limitation: running pystray in thread crashes with Tkinter
-            import platform
             if platform.system() == "Darwin":
                  print("⚠️ System Tray disabled on macOS (avoids conflict with Settings UI).")
                  print("   The Settings window will open instead.")
                  return False
 
-            image = Image.new("RGBA", (icon_size, icon_size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(image)
-
-            # Draw a circle (Sati symbol)
-            margin = 8
-            draw.ellipse(
-                [margin, margin, icon_size - margin, icon_size - margin],
-                outline="#4ADE80",
-                width=4,
-            )
+            # Icons for every state, so state changes only swap images
+            self._state_images = {state: _render_icon(state) for state in _STATE_COLORS}
+            self._state = "active"
+            image = self._state_images["active"]
 
             # Create menu
             menu = pystray.Menu(
@@ -108,11 +139,8 @@ class TrayIcon:
         if self.on_pause_click:
             self.on_pause_click()
 
-        # Update tray icon would require recreation
-        if self._paused:
-            self.set_state("paused")
-        else:
-            self.set_state("active")
+        # No-op if the icon already shows this state
+        self.set_state("paused" if self._paused else "active")
 
     def set_state(self, state: str) -> None:
         """
@@ -123,38 +151,14 @@ class TrayIcon:
         if not self._icon:
             return
 
-        try:
-            from PIL import Image, ImageDraw
-
-            icon_size = 64
-            image = Image.new("RGBA", (icon_size, icon_size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(image)
-            margin = 8
-
-            # Color based on state
-            colors = {
-                "active": "#4ADE80",   # Green
-                "paused": "#6E6E73",   # Gray
-                "stress": "#F97316",   # Orange
-                "flow": "#818CF8",     # Purple
-            }
-            color = colors.get(state, "#4ADE80")
-
-            # Draw circle (filled for stress/flow, outline for others)
-            if state in ("stress", "flow"):
-                draw.ellipse(
-                    [margin, margin, icon_size - margin, icon_size - margin],
-                    fill=color,
-                )
-            else:
-                draw.ellipse(
-                    [margin, margin, icon_size - margin, icon_size - margin],
-                    outline=color,
-                    width=4,
-                )
-
-            self._icon.icon = image
+        if state not in self._state_images:
+            state = "active"
+        if state == self._state:
+            return
 
+        try:
+            self._icon.icon = self._state_images[state]
+            self._state = state
         except Exception as e:
             print(f"⚠️ Could not update tray icon: {e}")
 
@@ -9,12 +9,20 @@ from __future__ import annotations
 
 import customtkinter as ctk
 from collections import deque
-from datetime import datetime
+import time
 
 
 class FloatingWidget:
     """Draggable floating widget with expandable log panel."""
 
+    # Button color, button icon and log text per status
+    _STATUS_CONFIG = {
+        "stress": ("#F97316", "⚡", "Stress detected"),
+        "flow": ("#818CF8", "🌊", "Flow state"),
+        "paused": ("#6E6E73", "⏸️", "Paused"),
+        "active": ("#4ADE80", "👁️", "Monitoring"),
+    }
+
     def __init__(
         self,
         root: ctk.CTk,
@@ -26,7 +34,13 @@ class FloatingWidget:
         self.on_right_click = on_right_click
         self._dragged = False
         self._expanded = False
-        self._logs = deque(maxlen=50)
+        self._shown_status = ("#4ADE80", "👁️")  # Button color and icon as drawn
+        self._ts_second = -1  # Second that _ts_text was formatted for
+        self._ts_text = ""
+        self._logs = deque(maxlen=50)  # Source of truth for the log panel
+        self._text_lines = 0  # Entries currently in the textbox
+        self._log_buffer: list[str] = []  # Entries waiting for the next flush
+        self._flush_scheduled = False
 
         # Configure root
         self.root.overrideredirect(True)
@@ -66,7 +80,53 @@ class FloatingWidget:
         )
         self.toggle_btn.pack(pady=(0, 4))
 
-        # Log panel frame (hidden initially)
+        # Log panel, built on first expand (most sessions never open it)
+        self.log_frame: ctk.CTkFrame | None = None
+        self.log_text: ctk.CTkTextbox | None = None
+
+        # Drag state: pointer offset from the window's corner, and the
+        # position waiting to be applied
+        self._drag_data = {"x": 0, "y": 0}
+        self._pending_geom: str | None = None
+        self._geom_scheduled = False
+
+        # Bind drag to container (not button, so button clicks work)
+        self.container.bind("<Button-1>", self._on_press)
+        self.container.bind("<B1-Motion>", self._on_drag)
+        
+        # Initial log
+        self.log("🧘 OpenSati started")
+
+    def _on_button_click(self):
+        """Main button clicked - show settings."""
+        if self.on_click:
+            self.on_click()
+
+    def _on_press(self, event):
+        """Start drag."""
+        self._drag_data["x"] = event.x_root - self.root.winfo_x()
+        self._drag_data["y"] = event.y_root - self.root.winfo_y()
+
+    def _on_drag(self, event):
+        """Drag the widget."""
+        x = event.x_root - self._drag_data["x"]
+        y = event.y_root - self._drag_data["y"]
+        self._pending_geom = f"+{x}+{y}"
+
+        # Motion events outpace window moves; apply only the latest per idle
+        if not self._geom_scheduled:
+            self._geom_scheduled = True
+            self.root.after_idle(self._apply_geom)
+
+    def _apply_geom(self):
+        """Move the window to the most recent drag position."""
+        self._geom_scheduled = False
+        if self._pending_geom is not None:
+            self.root.geometry(self._pending_geom)
+            self._pending_geom = None
+
+    def _build_log_panel(self):
+        """Create the log panel and fill it with the entries logged so far."""
         self.log_frame = ctk.CTkFrame(self.container, fg_color="#2C2C2E", corner_radius=10)
         
         # Log textbox
@@ -101,81 +161,91 @@ class FloatingWidget:
             command=self._clear_log
         ).pack(side="right", padx=2)
 
-        # Drag state
-        self._drag_data = {"x": 0, "y": 0}
-
-        # Bind drag to container (not button, so button clicks work)
-        self.container.bind("<Button-1>", self._on_press)
-        self.container.bind("<B1-Motion>", self._on_drag)
-        
-        # Initial log
-        self.log("🧘 OpenSati started")
-
-    def _on_button_click(self):
-        """Main button clicked - show settings."""
-        if self.on_click:
-            self.on_click()
-
-    def _on_press(self, event):
-        """Start drag."""
-        self._drag_data["x"] = event.x_root
-        self._drag_data["y"] = event.y_root
-
-    def _on_drag(self, event):
-        """Drag the widget."""
-        x = self.root.winfo_x() + (event.x_root - self._drag_data["x"])
-        y = self.root.winfo_y() + (event.y_root - self._drag_data["y"])
-        self.root.geometry(f"+{x}+{y}")
-        self._drag_data["x"] = event.x_root
-        self._drag_data["y"] = event.y_root
+    def _sync_log_text(self):
+        """Replace the textbox contents with the retained log entries."""
+        self.log_text.configure(state="normal")
+        self.log_text.delete("1.0", "end")
+        if self._logs:
+            self.log_text.insert("end", "\n".join(self._logs) + "\n")
+        self.log_text.see("end")
+        self.log_text.configure(state="disabled")
+        self._text_lines = len(self._logs)
+        self._log_buffer.clear()  # Already included above
 
     def toggle_expand(self):
         """Toggle log panel."""
         self._expanded = not self._expanded
-        x, y = self.root.winfo_x(), self.root.winfo_y()
-        
+
+        # Size-only geometry keeps the window where it is; the repack and
+        # resize are laid out together on the next idle pass
         if self._expanded:
+            if self.log_frame is None:
+                self._build_log_panel()
+            # Catch up on entries logged while collapsed, in one insert
+            self._sync_log_text()
             self.log_frame.pack(fill="both", expand=True, padx=5, pady=(0, 5))
-            self.root.geometry(f"300x350+{x}+{y}")
+            self.root.geometry("300x350")
             self.toggle_btn.configure(text="▲")
             self.log("📋 Log panel opened")
         else:
             self.log_frame.pack_forget()
-            self.root.geometry(f"80x80+{x}+{y}")
+            self.root.geometry("80x80")
             self.toggle_btn.configure(text="▼")
 
     def _clear_log(self):
         """Clear log entries."""
         self._logs.clear()
-        self.log_text.configure(state="normal")
-        self.log_text.delete("1.0", "end")
-        self.log_text.configure(state="disabled")
+        self._sync_log_text()
         self.log("🗑️ Log cleared")
 
     def log(self, message: str):
-        """Add timestamped log entry."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        entry = f"[{timestamp}] {message}"
-        self._logs.append(entry)
-        
+        """Add timestamped log entry (one per line of message)."""
+        # Format the timestamp once per second, not once per call
+        second = int(time.time())
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_text = time.strftime("%H:%M:%S", time.localtime(second))
+        timestamp = self._ts_text
+        entries = [f"[{timestamp}] {line}" for line in message.split("\n")]
+        self._logs.extend(entries)
+        if not self._expanded:
+            return  # Invisible; synced from the deque when expanded
+
+        # Bursts of log calls share one textbox update when the loop goes idle
+        self._log_buffer.extend(entries)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_logs)
+
+    def _flush_logs(self):
+        """Write buffered log entries to the textbox in one batch."""
+        self._flush_scheduled = False
+        entries, self._log_buffer = self._log_buffer, []
+        if not entries or not self._expanded:
+            return
+
+        # Insert all lines in one call so the textbox redraws once, and drop
+        # lines the deque no longer holds so the textbox stays bounded
         self.log_text.configure(state="normal")
-        self.log_text.insert("end", entry + "\n")
+        self.log_text.insert("end", "\n".join(entries) + "\n")
+        excess = self._text_lines + len(entries) - len(self._logs)
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+        self._text_lines = len(self._logs)
         self.log_text.see("end")
         self.log_text.configure(state="disabled")
 
     def set_color(self, color: str):
         """Update button color."""
         self.button.configure(fg_color=color)
+        self._shown_status = (color, self._shown_status[1])
 
     def set_status(self, status: str):
         """Update status and log it."""
-        config = {
-            "stress": ("#F97316", "⚡", "Stress detected"),
-            "flow": ("#818CF8", "🌊", "Flow state"),
-            "paused": ("#6E6E73", "⏸️", "Paused"),
-            "active": ("#4ADE80", "👁️", "Monitoring"),
-        }
-        color, icon, msg = config.get(status, ("#4ADE80", "👁️", "Active"))
-        self.set_color(color)
-        self.button.configure(text=icon)
+        color, icon, msg = self._STATUS_CONFIG.get(status, ("#4ADE80", "👁️", "Active"))
+
+        # Repeated statuses are still logged, but the button isn't redrawn
+        if (color, icon) != self._shown_status:
+            self._shown_status = (color, icon)
+            self.button.configure(fg_color=color, text=icon)
         self.log(f"Status: {msg}")
@@ -0,0 +1,28 @@
+"""Tests for breathing analysis."""
+
+import numpy as np
+import pytest
+
+from opensati.core.audio import AudioSensor
+
+
+class TestBreathingRate:
+    """Test breathing rate estimation from the audio ring."""
+
+    def test_detects_modulated_breathing(self):
+        """A noise envelope breathing at 25/min should read as stressed breathing."""
+        pytest.importorskip("scipy")
+
+        sensor = AudioSensor(sample_rate=4410, analysis_window=60)
+        rng = np.random.default_rng(0)
+        t = np.arange(4410 * 70) / 4410
+        audio = rng.standard_normal(t.size) * (0.55 + 0.45 * np.sin(2 * np.pi * t * 25 / 60))
+        audio = audio.astype(np.float32) * 0.05
+
+        # Feed the ring directly; the PyAudio callback needs a live stream
+        sensor._buf[:] = audio[-sensor._buf.size :]
+        sensor._filled = sensor._buf.size
+
+        rate, confidence = sensor._estimate_breathing_rate()
+        assert rate == pytest.approx(25, abs=1)
+        assert confidence > 0.5
@@ -13,20 +13,31 @@ requires_display = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(scope="session")
+def default_settings():
+    """Default settings, built once (tests must not mutate them)."""
+    return Settings()
+
+
+@pytest.fixture(scope="session")
+def calm_detector(default_settings):
+    """Detector on default settings that is never started."""
+    return StressDetector(settings=default_settings)
+
+
 class TestStressDetector:
     """Test stress detection logic."""
 
-    def test_initial_state_is_calm(self):
+    def test_initial_state_is_calm(self, calm_detector):
         """Detector should start in calm state."""
-        detector = StressDetector(settings=Settings())
-        state = detector.get_state()
+        state = calm_detector.get_state()
 
         assert state.level == StressLevel.CALM
         assert state.score == 0.0
 
     def test_can_intervene_after_cooldown(self):
         """Should respect cooldown period."""
-        settings = Settings()
+        settings = Settings()  # Own copy: the shared defaults must stay untouched
         settings.intervention.cooldown = 1  # 1 second for test
 
         detector = StressDetector(settings=settings)
@@ -0,0 +1,61 @@
+"""Tests for sentiment pre-filtering and response parsing."""
+
+from opensati.ai.ollama_client import OllamaClient
+from opensati.ai.sentiment import SentimentAnalyzer, is_potentially_charged
+
+
+class TestChargedTextFilter:
+    """Test the lexical filter that gates LLM calls."""
+
+    def test_neutral_text_is_not_charged(self):
+        """Everyday messages should skip the LLM."""
+        assert not is_potentially_charged("Sounds good, meeting at 3 tomorrow then")
+        assert not is_potentially_charged("Thanks for the review, I pushed the fix")
+
+    def test_aggressive_words_are_charged(self):
+        """Insults and hostile words should escalate."""
+        assert is_potentially_charged("This is a stupid idea and you know it")
+        assert is_potentially_charged("Honestly this code is GARBAGE.")
+
+    def test_aggressive_phrases_are_charged(self):
+        """Passive-aggressive phrasing should escalate."""
+        assert is_potentially_charged("You never read the docs before asking")
+        assert is_potentially_charged("Per my last email, the deadline is Friday")
+        assert is_potentially_charged("Why is this still broken!!")
+
+
+class TestSentimentAnalyzer:
+    """Test analyzer behavior that does not need Ollama."""
+
+    def test_neutral_text_skips_llm(self):
+        """Neutral text should return without contacting the model."""
+        analyzer = SentimentAnalyzer()
+        analyzer._enabled = True
+
+        result = analyzer.analyze("Let's sync on the roadmap after lunch today")
+
+        assert result.sentiment == "neutral"
+        assert result.needs_reframe is False
+        assert analyzer._ollama_client is None
+
+
+class TestSentimentParsing:
+    """Test parsing of the model's sentiment response."""
+
+    def test_parses_sentiment_and_reframe(self, monkeypatch):
+        """Both fields should be read from a well-formed response."""
+        client = OllamaClient(model="llama3", vision_model="llava")
+        monkeypatch.setattr(
+            client,
+            "chat",
+            lambda prompt: "SENTIMENT: Aggressive\r\nREFRAME: Could we revisit this?  \n",
+        )
+
+        assert client.analyze_sentiment("text") == ("aggressive", "Could we revisit this?")
+
+    def test_none_reframe_is_dropped(self, monkeypatch):
+        """A reframe of "none" should mean no suggestion."""
+        client = OllamaClient(model="llama3", vision_model="llava")
+        monkeypatch.setattr(client, "chat", lambda prompt: "SENTIMENT: neutral\nREFRAME: none")
+
+        assert client.analyze_sentiment("text") == ("neutral", None)
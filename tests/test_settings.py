@@ -48,6 +48,38 @@ class TestSettings:
             assert loaded.detection.stress_threshold == 75
             assert loaded.intervention.style == "blur"
 
+    def test_save_and_load_json(self):
+        """Settings should round-trip through JSON too."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.json"
+
+            settings = Settings()
+            settings.detection.stress_threshold = 60
+            settings.ai.model = "mistral"
+            settings.save(path)
+
+            loaded = Settings.load(path)
+
+            assert loaded.detection.stress_threshold == 60
+            assert loaded.ai.model == "mistral"
+
+    def test_save_keeps_all_sections(self):
+        """Sections without explicit save code should survive a round-trip."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.yaml"
+
+            settings = Settings()
+            settings.intent.check_interval = 45
+            settings.posture.neck_angle_threshold = 20
+            settings.meeting.apps = ["Zoom"]
+            settings.save(path)
+
+            loaded = Settings.load(path)
+
+            assert loaded.intent.check_interval == 45
+            assert loaded.posture.neck_angle_threshold == 20
+            assert loaded.meeting.apps == ["Zoom"]
+
 
 class TestPrivacyDefaults:
     """Verify privacy settings are secure by default."""